@@ -326,8 +326,8 @@ def correct(
                 spdx_info = parser.parse_file(file_info)
                 file_info.spdx_info = spdx_info
 
-                # Validate SPDX information
-                validation_result = validator.validate(spdx_info)
+                # Validate SPDX information (only pass/fail is needed here)
+                validation_result = validator.validate(spdx_info, fast_only=True)
 
                 # Create scan result
                 scan_result = ScanResult(
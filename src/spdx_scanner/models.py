@@ -6,11 +6,31 @@ for representing SPDX license information, file metadata, validation results,
 and correction results.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import List, Optional, Dict, Any, Union, Tuple, Type, TypeVar, cast
+
+
+_T = TypeVar("_T")
+
+
+def _with_slots(cls: Type[_T]) -> Type[_T]:
+    """Recreate a dataclass with ``__slots__`` for its fields.
+
+    Equivalent to ``@dataclass(slots=True)``, which requires Python 3.10.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Drop default values stored as class attributes; they would clash
+        # with the slot descriptors. The generated __init__ keeps its own copy.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return cast(Type[_T], type(cls.__name__, cls.__bases__, cls_dict))
 
 
 class SPDXDeclarationType(Enum):
@@ -28,6 +48,29 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
+class ValidationCode(str, Enum):
+    """Stable machine-readable codes for validation issues."""
+    VALIDATION_FAILED = "E000"
+    MISSING_LICENSE_ID = "E001"
+    INVALID_LICENSE_ID = "E002"
+    INVALID_LICENSE_FORMAT = "E003"
+    MISSING_COPYRIGHT = "E004"
+    INVALID_COPYRIGHT_FORMAT = "E005"
+    MISSING_PROJECT_ATTRIBUTION = "E006"
+    MISSING_SPDX_VERSION = "E007"
+    UNKNOWN_LICENSE_ID = "W001"
+    NON_OSI_LICENSE = "W002"
+    UNUSUAL_COPYRIGHT_YEAR = "W003"
+    FUTURE_COPYRIGHT_YEAR = "W004"
+    SHORT_PROJECT_ATTRIBUTION = "W005"
+    UNUSUAL_SPDX_VERSION = "W006"
+    EMPTY_CONTRIBUTORS = "W007"
+    INVALID_DOWNLOAD_LOCATION = "W008"
+    INVALID_HOMEPAGE = "W009"
+    LICENSE_WHITESPACE = "W010"
+
+
+@_with_slots
 @dataclass
 class ValidationError:
     """Represents a validation error or warning."""
@@ -37,13 +80,27 @@ class ValidationError:
     column: Optional[int] = None
     rule_id: Optional[str] = None
     suggestion: Optional[str] = None
+    code: Optional[ValidationCode] = None
 
     def __post_init__(self) -> None:
         """Validate the error data."""
         if not self.message:
             raise ValueError("Validation error message cannot be empty")
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "severity": self.severity.value,
+            "message": self.message,
+            "line_number": self.line_number,
+            "column": self.column,
+            "rule_id": self.rule_id,
+            "suggestion": self.suggestion,
+            "code": self.code.value if self.code else None,
+        }
+
 
+@_with_slots
 @dataclass
 class SPDXInfo:
     """Represents SPDX license information extracted from a file."""
@@ -90,17 +147,7 @@ class SPDXInfo:
             "spdx_version": self.spdx_version,
             "additional_tags": self.additional_tags,
             "declaration_type": self.declaration_type.value,
-            "validation_errors": [
-                {
-                    "severity": error.severity.value,
-                    "message": error.message,
-                    "line_number": error.line_number,
-                    "column": error.column,
-                    "rule_id": error.rule_id,
-                    "suggestion": error.suggestion,
-                }
-                for error in self.validation_errors
-            ],
+            "validation_errors": [error.to_dict() for error in self.validation_errors],
             "raw_declaration": self.raw_declaration,
             "line_range": self.line_range,
         }
@@ -117,6 +164,7 @@ class SPDXInfo:
                 column=error_data.get("column"),
                 rule_id=error_data.get("rule_id"),
                 suggestion=error_data.get("suggestion"),
+                code=ValidationCode(error_data["code"]) if error_data.get("code") else None,
             )
             validation_errors.append(error)
 
@@ -225,6 +273,7 @@ class FileInfo:
         )
 
 
+@_with_slots
 @dataclass
 class ValidationResult:
     """Represents the result of SPDX validation."""
@@ -233,20 +282,43 @@ class ValidationResult:
     warnings: List[ValidationError] = field(default_factory=list)
     suggestions: List[str] = field(default_factory=list)
     validation_time: Optional[float] = None
+    errors_by_code: Dict[ValidationCode, List[ValidationError]] = field(default_factory=dict)
+    warnings_by_code: Dict[ValidationCode, List[ValidationError]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Index any errors and warnings passed at construction by code."""
+        for error in self.errors:
+            if error.code is not None:
+                self.errors_by_code.setdefault(error.code, []).append(error)
+        for warning in self.warnings:
+            if warning.code is not None:
+                self.warnings_by_code.setdefault(warning.code, []).append(warning)
 
     def add_error(self, error: ValidationError) -> None:
         """Add a validation error."""
         self.errors.append(error)
+        if error.code is not None:
+            self.errors_by_code.setdefault(error.code, []).append(error)
         self.is_valid = False
 
     def add_warning(self, warning: ValidationError) -> None:
         """Add a validation warning."""
         self.warnings.append(warning)
+        if warning.code is not None:
+            self.warnings_by_code.setdefault(warning.code, []).append(warning)
 
     def add_suggestion(self, suggestion: str) -> None:
         """Add a suggestion for improvement."""
         self.suggestions.append(suggestion)
 
+    def has_errors(self) -> bool:
+        """Check if any validation errors were recorded."""
+        return bool(self.errors)
+
+    def error_count(self) -> int:
+        """Get the number of validation errors."""
+        return len(self.errors)
+
     def get_all_issues(self) -> List[ValidationError]:
         """Get all validation issues (errors and warnings)."""
         return self.errors + self.warnings
@@ -264,8 +336,8 @@ class ValidationResult:
         """Convert to dictionary for serialization."""
         return {
             "is_valid": self.is_valid,
-            "errors": [error.__dict__ for error in self.errors],
-            "warnings": [warning.__dict__ for warning in self.warnings],
+            "errors": [error.to_dict() for error in self.errors],
+            "warnings": [warning.to_dict() for warning in self.warnings],
             "suggestions": self.suggestions,
             "validation_time": self.validation_time,
         }
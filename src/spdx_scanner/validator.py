@@ -5,18 +5,69 @@ This module provides functionality to validate SPDX license declarations
 against the SPDX specification and UnionTech requirements.
 """
 
-import json
 import re
-from typing import List, Optional, Dict, Set, Any
-from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 import logging
+import time
 from datetime import datetime
+from enum import IntFlag
 
-from .models import SPDXInfo, ValidationResult, ValidationError, ValidationSeverity
+from .models import SPDXInfo, ValidationCode, ValidationResult, ValidationError, ValidationSeverity
 
 
 logger = logging.getLogger(__name__)
 
+# Cached so copyright checks do not read the clock for every file
+_CURRENT_YEAR = datetime.now().year
+
+
+def refresh_current_year() -> int:
+    """Refresh the cached current year (for long-running processes)."""
+    global _CURRENT_YEAR
+    _CURRENT_YEAR = datetime.now().year
+    return _CURRENT_YEAR
+
+
+class Rules(IntFlag):
+    """Boolean validation rules packed into a single bitmask."""
+    REQUIRE_LICENSE = 1
+    REQUIRE_COPYRIGHT = 2
+    ALLOW_UNKNOWN = 4
+    REQUIRE_ATTRIBUTION = 8
+    REQUIRE_VERSION = 16
+    REQUIRE_OSI = 32
+
+
+# Mapping of boolean rule names to their flag bits
+_RULE_FLAGS = {
+    'require_license_identifier': Rules.REQUIRE_LICENSE,
+    'require_copyright': Rules.REQUIRE_COPYRIGHT,
+    'allow_unknown_licenses': Rules.ALLOW_UNKNOWN,
+    'require_project_attribution': Rules.REQUIRE_ATTRIBUTION,
+    'require_spdx_version': Rules.REQUIRE_VERSION,
+    'require_osi_approved': Rules.REQUIRE_OSI,
+}
+
+# Accepted copyright formats, capturing the year block in a single pass:
+# "Copyright (c) [year(s)] [holder]", "© [year(s)] [holder]",
+# "Copyright [year(s)] [holder]"
+_COPYRIGHT_PATTERN = re.compile(
+    r'^(?:Copyright\s*\(c\)\s*|©\s*|Copyright\s+)([0-9\-\,\s]+)\s+.+$',
+    re.IGNORECASE
+)
+_YEAR_PATTERN = re.compile(r'\b\d{4}\b')
+_LICENSE_CHARS_PATTERN = re.compile(r'^[A-Za-z0-9\-\+\.\(\)\s]+$')
+_REPEATED_OPERATOR_PATTERN = re.compile(r'(OR\s+OR|AND\s+AND|WITH\s+WITH)')
+_SPDX_VERSION_PATTERN = re.compile(r'^SPDX-[0-9]+\.[0-9]+$', re.IGNORECASE)
+_URL_PATTERN = re.compile(r'^https?://[A-Za-z0-9\-\._~:/?#\[\]@!$&\'()*+,;=]+$')
+
+# Additional tags that must hold a URL: (tag, label, rule_id, code)
+_URL_TAGS = (
+    ('download_location', 'download location', 'invalid_download_location',
+     ValidationCode.INVALID_DOWNLOAD_LOCATION),
+    ('homepage', 'homepage', 'invalid_homepage', ValidationCode.INVALID_HOMEPAGE),
+)
+
 
 class SPDXLicenseDatabase:
     """SPDX license database for validation."""
@@ -123,7 +174,7 @@ class SPDXLicenseDatabase:
     }
 
     # License exceptions (for "WITH" expressions)
-    LICENSE_EXCEPTIONS = {
+    LICENSE_EXCEPTIONS = frozenset({
         'Classpath-exception-2.0',
         'GPL-CC-1.0',
         'LLVM-exception',
@@ -132,13 +183,18 @@ class SPDXLicenseDatabase:
         'OCaml-LGPL-linking-exception',
         'Qt-GPL-exception-1.0',
         'Universal-FOSS-exception-1.0',
-    }
+    })
 
     @classmethod
     def is_valid_license_id(cls, license_id: str) -> bool:
         """Check if license ID is valid."""
         license_id = license_id.strip()
 
+        # Fast path: a single identifier has no operators or grouping, so it
+        # never needs expression parsing or the exception table
+        if ' ' not in license_id and '(' not in license_id:
+            return license_id in cls.CORE_LICENSES
+
         # Handle parentheses for grouping - recursively validate content
         if license_id.startswith('(') and license_id.endswith(')'):
             return cls.is_valid_license_id(license_id[1:-1])
@@ -199,6 +255,7 @@ class SPDXValidator:
         self.config = config or {}
         self.license_db = SPDXLicenseDatabase()
         self.validation_rules = self._load_validation_rules()
+        self._rules_mask = self._build_rules_mask()
 
     def _load_validation_rules(self) -> Dict[str, Any]:
         """Load validation rules from configuration."""
@@ -210,7 +267,7 @@ class SPDXValidator:
             'require_osi_approved': False,
             'require_spdx_version': False,
             'min_copyright_year': 1970,
-            'max_copyright_year': datetime.now().year + 1,
+            'max_copyright_year': _CURRENT_YEAR + 1,
             'copyright_format': 'standard',  # 'standard', 'flexible', 'any'
             'license_format': 'strict',  # 'strict', 'flexible'
         }
@@ -219,10 +276,23 @@ class SPDXValidator:
         default_rules.update(self.config.get('validation_rules', {}))
         return default_rules
 
-    def validate(self, spdx_info: SPDXInfo) -> ValidationResult:
-        """Validate SPDX information."""
+    def _build_rules_mask(self) -> int:
+        """Pack the boolean validation rules into an integer bitmask."""
+        mask = 0
+        for rule, flag in _RULE_FLAGS.items():
+            if self.validation_rules.get(rule):
+                mask |= flag
+        return int(mask)
+
+    def validate(self, spdx_info: SPDXInfo, fast_only: bool = False) -> ValidationResult:
+        """Validate SPDX information.
+
+        With ``fast_only`` the best-practice checks, which only add
+        suggestions and advisory warnings, are skipped. Use it when only the
+        pass/fail outcome is needed.
+        """
         result = ValidationResult(is_valid=True)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
             # Validate license identifier
@@ -241,30 +311,55 @@ class SPDXValidator:
             self._validate_additional_tags(spdx_info, result)
 
             # Check for recommended practices
-            self._validate_best_practices(spdx_info, result)
+            if not fast_only:
+                self._validate_best_practices(spdx_info, result)
 
         except Exception as e:
             logger.error(f"Validation error: {e}")
             result.add_error(ValidationError(
                 severity=ValidationSeverity.ERROR,
                 message=f"Validation failed: {str(e)}",
-                rule_id="validation_error"
+                rule_id="validation_error",
+                code=ValidationCode.VALIDATION_FAILED,
             ))
 
         # Calculate validation time
-        end_time = datetime.now()
-        result.validation_time = (end_time - start_time).total_seconds()
+        result.validation_time = time.perf_counter() - start_time
 
         return result
 
+    def validate_many(self, spdx_infos: Iterable[SPDXInfo]) -> List[ValidationResult]:
+        """Validate several SPDX declarations, validating each distinct one once.
+
+        Files in the same project usually share an identical header, so inputs
+        are grouped by the fields that affect validation. Inputs with equal
+        fields share the same ValidationResult instance.
+        """
+        cache: Dict[Tuple[Any, ...], ValidationResult] = {}
+        results = []
+        for spdx_info in spdx_infos:
+            key = (
+                spdx_info.license_identifier,
+                spdx_info.copyright_text,
+                spdx_info.project_attribution,
+                spdx_info.spdx_version,
+                tuple(sorted(spdx_info.additional_tags.items())),
+            )
+            result = cache.get(key)
+            if result is None:
+                result = cache[key] = self.validate(spdx_info)
+            results.append(result)
+        return results
+
     def _validate_license_identifier(self, spdx_info: SPDXInfo, result: ValidationResult) -> None:
         """Validate license identifier."""
-        if self.validation_rules['require_license_identifier']:
+        if self._rules_mask & Rules.REQUIRE_LICENSE:
             if not spdx_info.license_identifier:
                 result.add_error(ValidationError(
                     severity=ValidationSeverity.ERROR,
                     message="Missing required SPDX license identifier",
                     rule_id="missing_license_identifier",
+                    code=ValidationCode.MISSING_LICENSE_ID,
                     suggestion="Add 'SPDX-License-Identifier: [LICENSE-ID]' to your file header"
                 ))
                 return
@@ -278,16 +373,18 @@ class SPDXValidator:
                     severity=ValidationSeverity.ERROR,
                     message=f"Invalid SPDX license identifier format: {license_id}",
                     rule_id="invalid_license_format",
+                    code=ValidationCode.INVALID_LICENSE_FORMAT,
                     suggestion="Use a valid SPDX license identifier format"
                 ))
 
             # Check against license database
             if not self.license_db.is_valid_license_id(license_id):
-                if self.validation_rules['allow_unknown_licenses']:
+                if self._rules_mask & Rules.ALLOW_UNKNOWN:
                     result.add_warning(ValidationError(
                         severity=ValidationSeverity.WARNING,
                         message=f"Unknown or unregistered SPDX license identifier: {license_id}",
                         rule_id="unknown_license_identifier",
+                        code=ValidationCode.UNKNOWN_LICENSE_ID,
                         suggestion="Consider using a license from the SPDX license list"
                     ))
                 else:
@@ -295,28 +392,31 @@ class SPDXValidator:
                         severity=ValidationSeverity.ERROR,
                         message=f"Invalid SPDX license identifier: {license_id}",
                         rule_id="invalid_license_identifier",
+                        code=ValidationCode.INVALID_LICENSE_ID,
                         suggestion="Use a valid SPDX license identifier from https://spdx.org/licenses/"
                     ))
 
             # Check OSI approval if required
-            if self.validation_rules['require_osi_approved']:
+            if self._rules_mask & Rules.REQUIRE_OSI:
                 license_info = self.license_db.get_license_info(license_id)
                 if license_info and not license_info.get('is_osi_approved', False):
                     result.add_warning(ValidationError(
                         severity=ValidationSeverity.WARNING,
                         message=f"License is not OSI approved: {license_id}",
                         rule_id="non_osi_license",
+                        code=ValidationCode.NON_OSI_LICENSE,
                         suggestion="Consider using an OSI approved license"
                     ))
 
     def _validate_copyright(self, spdx_info: SPDXInfo, result: ValidationResult) -> None:
         """Validate copyright information."""
-        if self.validation_rules['require_copyright']:
+        if self._rules_mask & Rules.REQUIRE_COPYRIGHT:
             if not spdx_info.copyright_text:
                 result.add_error(ValidationError(
                     severity=ValidationSeverity.ERROR,
                     message="Missing required copyright information",
                     rule_id="missing_copyright",
+                    code=ValidationCode.MISSING_COPYRIGHT,
                     suggestion="Add copyright information in format: 'Copyright (c) [year] [holder]'"
                 ))
                 return
@@ -324,8 +424,9 @@ class SPDXValidator:
         if spdx_info.copyright_text:
             copyright_text = spdx_info.copyright_text.strip()
 
-            # Validate copyright format
-            if not self._is_valid_copyright_format(copyright_text):
+            # Validate copyright format and capture the year block in one pass
+            match = _COPYRIGHT_PATTERN.match(copyright_text)
+            if match is None:
                 severity = ValidationSeverity.WARNING
                 if self.validation_rules['copyright_format'] == 'standard':
                     severity = ValidationSeverity.ERROR
@@ -334,15 +435,19 @@ class SPDXValidator:
                     severity=severity,
                     message=f"Copyright format may be invalid: {copyright_text}",
                     rule_id="invalid_copyright_format",
+                    code=ValidationCode.INVALID_COPYRIGHT_FORMAT,
                     suggestion="Use format: 'Copyright (c) [year] [holder]'"
                 ))
 
             # Validate copyright years
-            years = self._extract_copyright_years(copyright_text)
+            if match is not None:
+                years = self._extract_copyright_years(match.group(1))
+            else:
+                years = self._extract_copyright_years(copyright_text)
             if years:
                 min_year = self.validation_rules['min_copyright_year']
                 max_year = self.validation_rules['max_copyright_year']
-                current_year = datetime.now().year
+                current_year = _CURRENT_YEAR
 
                 for year in years:
                     if year < min_year or year > max_year:
@@ -350,6 +455,7 @@ class SPDXValidator:
                             severity=ValidationSeverity.WARNING,
                             message=f"Copyright year {year} seems unusual",
                             rule_id="unusual_copyright_year",
+                            code=ValidationCode.UNUSUAL_COPYRIGHT_YEAR,
                             suggestion=f"Copyright year should be between {min_year} and {max_year}"
                         ))
                     elif year > current_year:
@@ -357,17 +463,19 @@ class SPDXValidator:
                             severity=ValidationSeverity.WARNING,
                             message=f"Copyright year {year} is in the future",
                             rule_id="future_copyright_year",
+                            code=ValidationCode.FUTURE_COPYRIGHT_YEAR,
                             suggestion="Copyright year should not be in the future"
                         ))
 
     def _validate_project_attribution(self, spdx_info: SPDXInfo, result: ValidationResult) -> None:
         """Validate project attribution."""
-        if self.validation_rules['require_project_attribution']:
+        if self._rules_mask & Rules.REQUIRE_ATTRIBUTION:
             if not spdx_info.project_attribution:
                 result.add_error(ValidationError(
                     severity=ValidationSeverity.ERROR,
                     message="Missing required project attribution",
                     rule_id="missing_project_attribution",
+                    code=ValidationCode.MISSING_PROJECT_ATTRIBUTION,
                     suggestion="Add project name or attribution information"
                 ))
 
@@ -378,17 +486,19 @@ class SPDXValidator:
                     severity=ValidationSeverity.WARNING,
                     message="Project attribution seems too short",
                     rule_id="short_project_attribution",
+                    code=ValidationCode.SHORT_PROJECT_ATTRIBUTION,
                     suggestion="Provide more descriptive project attribution"
                 ))
 
     def _validate_spdx_version(self, spdx_info: SPDXInfo, result: ValidationResult) -> None:
         """Validate SPDX version."""
-        if self.validation_rules['require_spdx_version']:
+        if self._rules_mask & Rules.REQUIRE_VERSION:
             if not spdx_info.spdx_version:
                 result.add_error(ValidationError(
                     severity=ValidationSeverity.ERROR,
                     message="Missing required SPDX version",
                     rule_id="missing_spdx_version",
+                    code=ValidationCode.MISSING_SPDX_VERSION,
                     suggestion="Add 'SPDX-Version: [version]' to your file header"
                 ))
 
@@ -399,6 +509,7 @@ class SPDXValidator:
                     severity=ValidationSeverity.WARNING,
                     message=f"Unusual SPDX version format: {version}",
                     rule_id="unusual_spdx_version",
+                    code=ValidationCode.UNUSUAL_SPDX_VERSION,
                     suggestion="Use format: 'SPDX-2.2' or similar"
                 ))
 
@@ -412,29 +523,20 @@ class SPDXValidator:
                     severity=ValidationSeverity.WARNING,
                     message="Empty contributor information",
                     rule_id="empty_contributors",
+                    code=ValidationCode.EMPTY_CONTRIBUTORS,
                     suggestion="Remove empty contributor tag or add contributor names"
                 ))
 
-        # Validate download location if present
-        if 'download_location' in spdx_info.additional_tags:
-            download_location = spdx_info.additional_tags['download_location']
-            if not self._is_valid_url(download_location):
+        # Validate URL-valued tags (download location, homepage) if present
+        for tag, label, rule_id, code in _URL_TAGS:
+            url = spdx_info.additional_tags.get(tag)
+            if url is not None and not self._is_valid_url(url):
                 result.add_warning(ValidationError(
                     severity=ValidationSeverity.WARNING,
-                    message=f"Invalid download location URL: {download_location}",
-                    rule_id="invalid_download_location",
-                    suggestion="Use a valid URL for download location"
-                ))
-
-        # Validate homepage if present
-        if 'homepage' in spdx_info.additional_tags:
-            homepage = spdx_info.additional_tags['homepage']
-            if not self._is_valid_url(homepage):
-                result.add_warning(ValidationError(
-                    severity=ValidationSeverity.WARNING,
-                    message=f"Invalid homepage URL: {homepage}",
-                    rule_id="invalid_homepage",
-                    suggestion="Use a valid URL for homepage"
+                    message=f"Invalid {label} URL: {url}",
+                    rule_id=rule_id,
+                    code=code,
+                    suggestion=f"Use a valid URL for {label}"
                 ))
 
     def _validate_best_practices(self, spdx_info: SPDXInfo, result: ValidationResult) -> None:
@@ -457,6 +559,7 @@ class SPDXValidator:
                     severity=ValidationSeverity.WARNING,
                     message="License identifier contains leading/trailing whitespace",
                     rule_id="license_whitespace",
+                    code=ValidationCode.LICENSE_WHITESPACE,
                     suggestion="Remove leading/trailing whitespace from license identifier"
                 ))
 
@@ -464,8 +567,7 @@ class SPDXValidator:
         """Check if license identifier has valid format."""
         # Basic SPDX license identifier format validation
         # Should contain only alphanumeric characters, hyphens, dots, plus signs, and parentheses
-        valid_chars = re.match(r'^[A-Za-z0-9\-\+\.\(\)\s]+$', license_id)
-        if not valid_chars:
+        if not _LICENSE_CHARS_PATTERN.match(license_id):
             return False
 
         # Should not be empty or just whitespace
@@ -473,47 +575,27 @@ class SPDXValidator:
             return False
 
         # Should not contain consecutive operators without proper grouping
-        if re.search(r'(OR\s+OR|AND\s+AND|WITH\s+WITH)', license_id):
+        if _REPEATED_OPERATOR_PATTERN.search(license_id):
             return False
 
         return True
 
     def _is_valid_copyright_format(self, copyright_text: str) -> bool:
         """Check if copyright text has valid format."""
-        # Standard copyright format: "Copyright (c) [year(s)] [holder]"
-        standard_pattern = r'^Copyright\s*\(c\)\s*[0-9\-\,\s]+\s+.+$'
-        if re.match(standard_pattern, copyright_text, re.IGNORECASE):
-            return True
-
-        # Alternative formats (more flexible)
-        alternative_patterns = [
-            r'^©\s*[0-9\-\,\s]+\s+.+$',  # "© [year(s)] [holder]"
-            r'^Copyright\s+[0-9\-\,\s]+\s+.+$',  # "Copyright [year(s)] [holder]"
-            r'^©\s+[0-9\-\,\s]+\s+.+$',  # "© [year(s)] [holder]"
-        ]
-
-        for pattern in alternative_patterns:
-            if re.match(pattern, copyright_text, re.IGNORECASE):
-                return True
-
-        return False
+        return _COPYRIGHT_PATTERN.match(copyright_text) is not None
 
     def _is_valid_spdx_version(self, version: str) -> bool:
         """Check if SPDX version has valid format."""
-        version_pattern = r'^SPDX-[0-9]+\.[0-9]+$'
-        return bool(re.match(version_pattern, version, re.IGNORECASE))
+        return _SPDX_VERSION_PATTERN.match(version) is not None
 
     def _is_valid_url(self, url: str) -> bool:
         """Check if string is a valid URL."""
-        url_pattern = r'^https?://[A-Za-z0-9\-\._~:/?#\[\]@!$&\'()*+,;=]+$'
-        return bool(re.match(url_pattern, url))
+        return _URL_PATTERN.match(url) is not None
 
     def _extract_copyright_years(self, copyright_text: str) -> List[int]:
         """Extract copyright years from copyright text."""
         # Match 4-digit years (e.g., 1800, 1970, 2025, etc.)
-        year_pattern = r'\b\d{4}\b'
-        years = re.findall(year_pattern, copyright_text)
-        return [int(year) for year in years]
+        return [int(year) for year in _YEAR_PATTERN.findall(copyright_text)]
 
     def get_validation_rules(self) -> Dict[str, Any]:
         """Get current validation rules."""
@@ -523,6 +605,8 @@ class SPDXValidator:
         """Update a validation rule."""
         if rule in self.validation_rules:
             self.validation_rules[rule] = value
+            if rule in _RULE_FLAGS:
+                self._rules_mask = self._build_rules_mask()
         else:
             logger.warning(f"Unknown validation rule: {rule}")
 
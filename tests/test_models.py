@@ -12,6 +12,7 @@ from spdx_scanner.models import (
     ValidationResult,
     ValidationError,
     ValidationSeverity,
+    ValidationCode,
     SPDXDeclarationType,
     CorrectionResult,
     ScanResult,
@@ -225,6 +226,54 @@ class TestValidationResult:
         all_issues = result.get_all_issues()
         assert len(all_issues) == 3  # 2 errors + 1 warning
 
+    def test_validation_result_indexes_by_code(self):
+        """Test that coded errors and warnings are indexed by code."""
+        error = ValidationError(
+            severity=ValidationSeverity.ERROR,
+            message="Missing license",
+            code=ValidationCode.MISSING_LICENSE_ID,
+        )
+        warning = ValidationError(
+            severity=ValidationSeverity.WARNING,
+            message="Unknown license",
+            code=ValidationCode.UNKNOWN_LICENSE_ID,
+        )
+
+        result = ValidationResult(is_valid=True)
+        result.add_error(error)
+        result.add_warning(warning)
+        result.add_error(ValidationError(severity=ValidationSeverity.ERROR, message="Uncoded"))
+
+        assert result.errors_by_code == {ValidationCode.MISSING_LICENSE_ID: [error]}
+        assert result.warnings_by_code == {ValidationCode.UNKNOWN_LICENSE_ID: [warning]}
+
+        # Errors passed at construction are indexed too
+        prebuilt = ValidationResult(is_valid=False, errors=[error])
+        assert ValidationCode.MISSING_LICENSE_ID in prebuilt.errors_by_code
+
+
+class TestModelSlots:
+    """Test that per-file models are slotted."""
+
+    def test_models_have_no_instance_dict(self):
+        """Test that slotted models reject unknown attributes."""
+        instances = [
+            SPDXInfo(license_identifier="MIT"),
+            ValidationError(severity=ValidationSeverity.ERROR, message="Error"),
+            ValidationResult(is_valid=True),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.unexpected_attribute = True
+
+    def test_slotted_defaults_are_not_shared(self):
+        """Test that mutable defaults are still created per instance."""
+        first = SPDXInfo()
+        second = SPDXInfo()
+        first.additional_tags["homepage"] = "https://example.com"
+        assert second.additional_tags == {}
+
 
 class TestValidationError:
     """Test ValidationError model."""
@@ -0,0 +1,48 @@
+"""
+Tests for the project refactor tool (tools/migration/refactor.py).
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+REFACTOR_PATH = Path(__file__).resolve().parent.parent / "tools" / "migration" / "refactor.py"
+
+
+@pytest.fixture
+def refactor_module():
+    """Load the refactor tool as a module."""
+    spec = importlib.util.spec_from_file_location("refactor_tool", REFACTOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBackupRequiredMigration:
+    """Test per-file backups on top of the full project backup."""
+
+    def test_backup_required_with_full_backup(self, refactor_module, tmp_path, monkeypatch):
+        """Test a backup_required migration after the full backup already linked the file."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "old_module.py").write_text("x = 1\n")
+
+        refactor = refactor_module.ProjectRefactor(backup=True)
+        assert refactor._create_backup()
+
+        migration = refactor_module.FileMigration(
+            source="old_module.py",
+            destination="pkg/new_module.py",
+            description="move module",
+            backup_required=True,
+        )
+        refactor.migration_results = [None]
+
+        assert refactor._execute_single_migration(migration, 0)
+
+        result = refactor.migration_results[0]
+        assert result.status == refactor_module.MigrationStatus.COMPLETED
+        assert (tmp_path / "pkg" / "new_module.py").read_text() == "x = 1\n"
+        assert (refactor.backup_dir / "old_module.py").read_text() == "x = 1\n"
+        assert not (tmp_path / "old_module.py").exists()
@@ -4,17 +4,33 @@ Tests for SPDX Scanner validator component.
 
 import pytest
 from datetime import datetime
-from spdx_scanner.validator import SPDXLicenseDatabase, SPDXValidator, create_default_validator
-from spdx_scanner.models import SPDXInfo, ValidationResult, ValidationError, ValidationSeverity
+from spdx_scanner.validator import (
+    Rules,
+    SPDXLicenseDatabase,
+    SPDXValidator,
+    create_default_validator,
+    refresh_current_year,
+)
+from spdx_scanner.models import SPDXInfo, ValidationCode, ValidationResult, ValidationError, ValidationSeverity
+
+
+@pytest.fixture(scope="module")
+def db():
+    """Shared license database; lookups never mutate it."""
+    return SPDXLicenseDatabase()
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Shared default validator for tests that do not modify its rules."""
+    return SPDXValidator()
 
 
 class TestSPDXLicenseDatabase:
     """Test SPDX license database."""
 
-    def test_is_valid_license_id_simple(self):
+    def test_is_valid_license_id_simple(self, db):
         """Test validation of simple license IDs."""
-        db = SPDXLicenseDatabase()
-
         # Valid licenses
         assert db.is_valid_license_id("MIT") is True
         assert db.is_valid_license_id("Apache-2.0") is True
@@ -26,10 +42,8 @@ class TestSPDXLicenseDatabase:
         assert db.is_valid_license_id("") is False
         assert db.is_valid_license_id("Made-Up-License") is False
 
-    def test_is_valid_license_id_with_exception(self):
+    def test_is_valid_license_id_with_exception(self, db):
         """Test validation of licenses with exceptions."""
-        db = SPDXLicenseDatabase()
-
         # Valid license with exception
         assert db.is_valid_license_id("GPL-3.0 WITH Classpath-exception-2.0") is True
         assert db.is_valid_license_id("GPL-2.0 WITH GPL-CC-1.0") is True
@@ -37,10 +51,8 @@ class TestSPDXLicenseDatabase:
         # Invalid exception
         assert db.is_valid_license_id("MIT WITH Invalid-exception") is False
 
-    def test_is_valid_license_id_with_or(self):
+    def test_is_valid_license_id_with_or(self, db):
         """Test validation of licenses with OR expressions."""
-        db = SPDXLicenseDatabase()
-
         # Valid OR expressions
         assert db.is_valid_license_id("MIT OR Apache-2.0") is True
         assert db.is_valid_license_id("GPL-3.0 OR BSD-3-Clause") is True
@@ -50,10 +62,8 @@ class TestSPDXLicenseDatabase:
         assert db.is_valid_license_id("MIT OR Invalid-License") is False
         assert db.is_valid_license_id("Invalid-License OR Apache-2.0") is False
 
-    def test_is_valid_license_id_with_and(self):
+    def test_is_valid_license_id_with_and(self, db):
         """Test validation of licenses with AND expressions."""
-        db = SPDXLicenseDatabase()
-
         # Valid AND expressions
         assert db.is_valid_license_id("MIT AND Apache-2.0") is True
         assert db.is_valid_license_id("GPL-3.0 AND BSD-3-Clause") is True
@@ -62,10 +72,8 @@ class TestSPDXLicenseDatabase:
         assert db.is_valid_license_id("MIT AND Invalid-License") is False
         assert db.is_valid_license_id("Invalid-License AND Apache-2.0") is False
 
-    def test_is_valid_license_id_with_parentheses(self):
+    def test_is_valid_license_id_with_parentheses(self, db):
         """Test validation of licenses with parentheses."""
-        db = SPDXLicenseDatabase()
-
         # Valid with parentheses
         assert db.is_valid_license_id("(MIT OR Apache-2.0)") is True
         assert db.is_valid_license_id("(MIT AND Apache-2.0) OR BSD-3-Clause") is True
@@ -73,18 +81,14 @@ class TestSPDXLicenseDatabase:
         # Invalid with parentheses
         assert db.is_valid_license_id("(Invalid-License)") is False
 
-    def test_is_valid_license_id_complex_expressions(self):
+    def test_is_valid_license_id_complex_expressions(self, db):
         """Test validation of complex license expressions."""
-        db = SPDXLicenseDatabase()
-
         # Complex but valid expressions
         assert db.is_valid_license_id("MIT OR (Apache-2.0 AND BSD-3-Clause)") is True
         assert db.is_valid_license_id("GPL-3.0 WITH Classpath-exception-2.0 OR MIT") is True
 
-    def test_get_license_info(self):
+    def test_get_license_info(self, db):
         """Test getting license information."""
-        db = SPDXLicenseDatabase()
-
         # Get info for known license
         info = db.get_license_info("MIT")
         assert info is not None
@@ -106,9 +110,8 @@ class TestSPDXLicenseDatabase:
 class TestSPDXValidator:
     """Test SPDX validator."""
 
-    def test_validator_initialization(self):
+    def test_validator_initialization(self, validator):
         """Test validator initialization."""
-        validator = SPDXValidator()
         assert validator.config == {}
         assert validator.license_db is not None
         assert validator.validation_rules is not None
@@ -127,10 +130,8 @@ class TestSPDXValidator:
         assert validator.validation_rules['require_copyright'] is False
         assert validator.validation_rules['allow_unknown_licenses'] is True
 
-    def test_validate_valid_spdx_info(self):
+    def test_validate_valid_spdx_info(self, validator):
         """Test validation of valid SPDX information."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="MIT",
             copyright_text="Copyright (c) 2023 Example Corp",
@@ -144,10 +145,8 @@ class TestSPDXValidator:
         assert len(result.errors) == 0
         assert len(result.warnings) == 0
 
-    def test_validate_missing_license_identifier(self):
+    def test_validate_missing_license_identifier(self, validator):
         """Test validation with missing license identifier."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             copyright_text="Copyright (c) 2023 Example Corp",
             project_attribution="Example Project",
@@ -157,12 +156,10 @@ class TestSPDXValidator:
 
         assert result.is_valid is False
         assert len(result.errors) == 1
-        assert any("Missing required SPDX license identifier" in error.message for error in result.errors)
+        assert ValidationCode.MISSING_LICENSE_ID in result.errors_by_code
 
-    def test_validate_invalid_license_identifier(self):
+    def test_validate_invalid_license_identifier(self, validator):
         """Test validation with invalid license identifier."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="INVALID-LICENSE",
             copyright_text="Copyright (c) 2023 Example Corp",
@@ -172,7 +169,7 @@ class TestSPDXValidator:
 
         assert result.is_valid is False
         assert len(result.errors) == 1
-        assert any("Invalid SPDX license identifier" in error.message for error in result.errors)
+        assert ValidationCode.INVALID_LICENSE_ID in result.errors_by_code
 
     def test_validate_unknown_license_with_allow_unknown(self):
         """Test validation with unknown license when allowed."""
@@ -192,12 +189,10 @@ class TestSPDXValidator:
 
         assert result.is_valid is True  # Should be valid when unknown licenses are allowed
         assert len(result.warnings) == 1
-        assert any("Unknown or unregistered SPDX license identifier" in warning.message for warning in result.warnings)
+        assert ValidationCode.UNKNOWN_LICENSE_ID in result.warnings_by_code
 
-    def test_validate_missing_copyright(self):
+    def test_validate_missing_copyright(self, validator):
         """Test validation with missing copyright."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="MIT",
             project_attribution="Example Project",
@@ -207,12 +202,10 @@ class TestSPDXValidator:
 
         assert result.is_valid is False
         assert len(result.errors) == 1
-        assert any("Missing required copyright information" in error.message for error in result.errors)
+        assert ValidationCode.MISSING_COPYRIGHT in result.errors_by_code
 
-    def test_validate_invalid_copyright_format(self):
+    def test_validate_invalid_copyright_format(self, validator):
         """Test validation with invalid copyright format."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="MIT",
             copyright_text="Invalid copyright format",
@@ -224,10 +217,8 @@ class TestSPDXValidator:
         assert len(result.warnings) >= 1
         assert any("Copyright format may be invalid" in warning.message for warning in result.warnings)
 
-    def test_validate_copyright_year_validation(self):
+    def test_validate_copyright_year_validation(self, validator):
         """Test validation of copyright years."""
-        validator = SPDXValidator()
-
         # Future year
         future_year = datetime.now().year + 5
         spdx_info = SPDXInfo(
@@ -249,7 +240,22 @@ class TestSPDXValidator:
         result = validator.validate(spdx_info)
 
         assert len(result.warnings) >= 1
-        assert any("Copyright year" in warning.message and "unusual" in warning.message for warning in result.warnings)
+        assert ValidationCode.UNUSUAL_COPYRIGHT_YEAR in result.warnings_by_code
+
+    def test_validate_copyright_alternative_formats(self, validator):
+        """Test that alternative copyright formats and year ranges are accepted."""
+        for copyright_text in (
+            "Copyright (c) 2019-2023 Example Corp",
+            "© 2020, 2021 Example Corp",
+            "Copyright 2023 Example Corp",
+        ):
+            result = validator.validate(SPDXInfo(
+                license_identifier="MIT",
+                copyright_text=copyright_text,
+            ))
+
+            assert result.is_valid is True
+            assert len(result.warnings) == 0
 
     def test_validate_project_attribution(self):
         """Test validation of project attribution."""
@@ -270,7 +276,7 @@ class TestSPDXValidator:
 
         assert result.is_valid is False
         assert len(result.errors) == 1
-        assert any("Missing required project attribution" in error.message for error in result.errors)
+        assert ValidationCode.MISSING_PROJECT_ATTRIBUTION in result.errors_by_code
 
     def test_validate_spdx_version(self):
         """Test validation of SPDX version."""
@@ -291,12 +297,10 @@ class TestSPDXValidator:
 
         assert result.is_valid is False
         assert len(result.errors) == 1
-        assert any("Missing required SPDX version" in error.message for error in result.errors)
+        assert ValidationCode.MISSING_SPDX_VERSION in result.errors_by_code
 
-    def test_validate_additional_tags(self):
+    def test_validate_additional_tags(self, validator):
         """Test validation of additional tags."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="MIT",
             copyright_text="Copyright (c) 2023 Example Corp",
@@ -311,14 +315,12 @@ class TestSPDXValidator:
 
         # Should have warnings about invalid URLs and empty contributors
         assert len(result.warnings) >= 2
-        assert any("Invalid homepage URL" in warning.message for warning in result.warnings)
-        assert any("Invalid download location URL" in warning.message for warning in result.warnings)
-        assert any("Empty contributor information" in warning.message for warning in result.warnings)
+        assert ValidationCode.INVALID_HOMEPAGE in result.warnings_by_code
+        assert ValidationCode.INVALID_DOWNLOAD_LOCATION in result.warnings_by_code
+        assert ValidationCode.EMPTY_CONTRIBUTORS in result.warnings_by_code
 
-    def test_validate_best_practices(self):
+    def test_validate_best_practices(self, validator):
         """Test validation of best practices."""
-        validator = SPDXValidator()
-
         # License without copyright
         spdx_info = SPDXInfo(
             license_identifier="MIT",
@@ -341,10 +343,20 @@ class TestSPDXValidator:
         assert len(result.suggestions) >= 1
         assert any("Consider adding license identifier" in suggestion for suggestion in result.suggestions)
 
-    def test_validate_license_whitespace(self):
-        """Test validation of license identifier whitespace."""
-        validator = SPDXValidator()
+    def test_validate_fast_only_skips_best_practices(self, validator):
+        """Test that fast_only keeps the outcome but skips suggestions."""
+        spdx_info = SPDXInfo(license_identifier="INVALID-LICENSE")
+
+        full = validator.validate(spdx_info)
+        fast = validator.validate(spdx_info, fast_only=True)
 
+        assert fast.is_valid is full.is_valid is False
+        assert fast.has_errors() and fast.error_count() == full.error_count()
+        assert full.suggestions
+        assert fast.suggestions == []
+
+    def test_validate_license_whitespace(self, validator):
+        """Test validation of license identifier whitespace."""
         spdx_info = SPDXInfo(
             license_identifier="  MIT  ",  # With whitespace
             copyright_text="Copyright (c) 2023 Example Corp",
@@ -353,12 +365,10 @@ class TestSPDXValidator:
         result = validator.validate(spdx_info)
 
         assert len(result.warnings) >= 1
-        assert any("License identifier contains leading/trailing whitespace" in warning.message for warning in result.warnings)
+        assert ValidationCode.LICENSE_WHITESPACE in result.warnings_by_code
 
-    def test_validation_result_summary(self):
+    def test_validation_result_summary(self, validator):
         """Test validation result summary."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="MIT",
             copyright_text="Copyright (c) 2023 Example Corp",
@@ -372,10 +382,8 @@ class TestSPDXValidator:
         assert summary["total_warnings"] == 0
         assert summary["total_suggestions"] == 0
 
-    def test_validation_result_all_issues(self):
+    def test_validation_result_all_issues(self, validator):
         """Test getting all validation issues."""
-        validator = SPDXValidator()
-
         spdx_info = SPDXInfo(
             license_identifier="INVALID-LICENSE",
             # Missing copyright
@@ -387,6 +395,18 @@ class TestSPDXValidator:
         assert len(all_issues) >= 2  # At least one error for invalid license and one for missing copyright
         assert all(isinstance(issue, ValidationError) for issue in all_issues)
 
+    def test_validate_many_deduplicates_identical_inputs(self, validator):
+        """Test that identical declarations are validated once and share a result."""
+        shared = dict(license_identifier="MIT", copyright_text="Copyright (c) 2023 Example Corp")
+        infos = [SPDXInfo(**shared), SPDXInfo(license_identifier="INVALID-LICENSE"), SPDXInfo(**shared)]
+
+        results = validator.validate_many(infos)
+
+        assert len(results) == 3
+        assert results[0] is results[2]
+        assert results[0].is_valid is True
+        assert results[1].is_valid is False
+
     def test_update_validation_rule(self):
         """Test updating validation rules."""
         validator = SPDXValidator()
@@ -399,10 +419,19 @@ class TestSPDXValidator:
         validator.update_validation_rule('non_existent_rule', True)
         # Should not crash, but should log a warning
 
-    def test_get_validation_rules(self):
-        """Test getting validation rules."""
+    def test_update_validation_rule_affects_validation(self):
+        """Test that updated boolean rules are honoured by validate()."""
         validator = SPDXValidator()
+        spdx_info = SPDXInfo(copyright_text="Copyright (c) 2023 Example Corp")
+
+        assert validator.validate(spdx_info).is_valid is False
+
+        validator.update_validation_rule('require_license_identifier', False)
+        assert not validator._rules_mask & Rules.REQUIRE_LICENSE
+        assert validator.validate(spdx_info).is_valid is True
 
+    def test_get_validation_rules(self, validator):
+        """Test getting validation rules."""
         rules = validator.get_validation_rules()
         assert isinstance(rules, dict)
         assert 'require_license_identifier' in rules
@@ -410,6 +439,18 @@ class TestSPDXValidator:
         assert 'allow_unknown_licenses' in rules
 
 
+class TestRefreshCurrentYear:
+    """Test the cached current year."""
+
+    def test_refresh_current_year(self, monkeypatch):
+        """Test that refreshing updates the year used by copyright checks."""
+        import spdx_scanner.validator as validator_module
+
+        monkeypatch.setattr(validator_module, "_CURRENT_YEAR", 1999)
+        assert refresh_current_year() == datetime.now().year
+        assert validator_module._CURRENT_YEAR == datetime.now().year
+
+
 class TestCreateDefaultValidator:
     """Test default validator creation."""
 
@@ -16,14 +16,43 @@ SPDX Scanner 代码质量分析工具
 import os
 import ast
 import json
+import html
+import time
+import pickle
+import sqlite3
+import hashlib
+import bisect
+import heapq
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Set, Any, Tuple, Optional, Iterator, NamedTuple
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
-import re
 
+try:
+    import orjson
+except ImportError:
+    # 未安装 orjson 时使用标准库 json
+    orjson = None
 
+
+def _with_slots(cls):
+    """为数据类重建带 __slots__ 的版本（等价于 Python 3.10+ 的 dataclass(slots=True)）"""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # 移除作为类属性保存的默认值，避免与槽描述符冲突
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_with_slots
 @dataclass
 class ComplexityMetric:
     """复杂度指标"""
@@ -35,6 +64,7 @@ class ComplexityMetric:
     class_count: int
 
 
+@_with_slots
 @dataclass
 class DependencyInfo:
     """依赖信息"""
@@ -45,6 +75,7 @@ class DependencyInfo:
     internal_imports: Set[str]
 
 
+@_with_slots
 @dataclass
 class CodeQualityReport:
     """代码质量报告"""
@@ -62,15 +93,344 @@ class CodeQualityReport:
     recommendations: List[str]
 
 
+class _Aggregates(NamedTuple):
+    """复杂度指标的汇总结果"""
+    total_lines: int
+    total_functions: int
+    total_classes: int
+    complexity_sum: int
+    distribution: Dict[str, int]
+    high_complexity_count: int
+
+
+# 最多保留的重复代码记录数（按相似度取最高的若干条）
+_MAX_DUPLICATE_PATTERNS = 1000
+
+# 复杂度分布的区间上界（含）及对应名称
+_COMPLEXITY_BOUNDS = [5, 10, 20]
+_COMPLEXITY_BUCKETS = ('low', 'medium', 'high', 'very_high')
+
+
+class ComplexityVisitor(ast.NodeVisitor):
+    """单次遍历同时收集复杂度指标和导入"""
+
+    def __init__(self):
+        self.cyclomatic_complexity = 1
+        self.cognitive_complexity = 0
+        self.max_nesting = 0
+        self.function_count = 0
+        self.class_count = 0
+        self.current_nesting = 0
+        self.imports: List[str] = []
+        self.defs: List[str] = []
+        self.classes: List[str] = []
+
+    def visit_If(self, node):
+        self.cyclomatic_complexity += 1
+        self.cognitive_complexity += 1 + self.current_nesting
+        self.current_nesting += 1
+        self.generic_visit(node)
+        self.current_nesting -= 1
+
+    def visit_While(self, node):
+        self.cyclomatic_complexity += 1
+        self.cognitive_complexity += 1 + self.current_nesting
+        self.current_nesting += 1
+        self.generic_visit(node)
+        self.current_nesting -= 1
+
+    def visit_For(self, node):
+        self.cyclomatic_complexity += 1
+        self.cognitive_complexity += 1 + self.current_nesting
+        self.current_nesting += 1
+        self.generic_visit(node)
+        self.current_nesting -= 1
+
+    def visit_ExceptHandler(self, node):
+        self.cyclomatic_complexity += 1
+        self.cognitive_complexity += 1 + self.current_nesting
+        self.generic_visit(node)
+
+    def visit_With(self, node):
+        self.cognitive_complexity += 1 + self.current_nesting
+        self.generic_visit(node)
+
+    def visit_And(self, node):
+        self.cognitive_complexity += 1
+        self.generic_visit(node)
+
+    def visit_Or(self, node):
+        self.cognitive_complexity += 1
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.function_count += 1
+        self.defs.append(node.name)
+        self.current_nesting += 1
+        self.generic_visit(node)
+        self.current_nesting -= 1
+        self.max_nesting = max(self.max_nesting, self.current_nesting)
+
+    def visit_ClassDef(self, node):
+        self.class_count += 1
+        self.classes.append(node.name)
+        self.current_nesting += 1
+        self.generic_visit(node)
+        self.current_nesting -= 1
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.imports.append(alias.name)
+
+    def visit_ImportFrom(self, node):
+        # 相对导入保留前导点号，以便依赖分析时解析
+        if node.module or node.level:
+            self.imports.append('.' * node.level + (node.module or ''))
+
+
+def _calculate_complexity(visitor: ComplexityVisitor, data: bytes) -> ComplexityMetric:
+    """根据遍历结果和源文件内容计算复杂度指标"""
+    return ComplexityMetric(
+        cyclomatic_complexity=visitor.cyclomatic_complexity,
+        cognitive_complexity=visitor.cognitive_complexity,
+        # 非空行数，直接在已读取的字节上统计
+        lines_of_code=sum(1 for line in data.splitlines() if line.strip()),
+        nesting_depth=visitor.max_nesting,
+        function_count=visitor.function_count,
+        class_count=visitor.class_count
+    )
+
+
+def _definition_signature(visitor: ComplexityVisitor) -> Optional[bytes]:
+    """根据函数名和类名计算文件的结构签名，用于重复检测"""
+    if not visitor.defs and not visitor.classes:
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(','.join(sorted(visitor.defs)).encode('utf-8'))
+    h.update(b'\0')
+    h.update(','.join(sorted(visitor.classes)).encode('utf-8'))
+    return h.digest()
+
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'spdx-checker' / 'ast_cache.sqlite'
+# 分析逻辑变化时修改此值，使旧的缓存条目自动失效
+_CACHE_VERSION = b'code-quality-5'
+_CACHE_MAX_AGE_DAYS = 30
+# 两次清理过期条目之间的最短间隔（秒），上次清理时间记录在缓存数据库中
+_CACHE_PURGE_INTERVAL = 86400
+# 缓存表结构变化时修改此值，旧表会被重建
+_CACHE_SCHEMA_VERSION = 2
+
+# 每个进程各自持有的缓存连接（sqlite连接不能跨fork共享）
+_cache_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+def _open_cache(cache_path: Path) -> sqlite3.Connection:
+    """打开缓存数据库并确保表结构存在"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(cache_path), timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _CACHE_SCHEMA_VERSION:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS ast_cache")
+            conn.execute(f"PRAGMA user_version = {_CACHE_SCHEMA_VERSION}")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ast_cache "
+        "(hash BLOB PRIMARY KEY, metric BLOB, imports BLOB, signature BLOB, created REAL)"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value REAL)")
+    return conn
+
+
+def _get_cache_connection(cache_path: Path) -> sqlite3.Connection:
+    """获取当前进程的缓存连接"""
+    key = (os.getpid(), str(cache_path))
+    conn = _cache_connections.get(key)
+    if conn is None:
+        conn = _cache_connections[key] = _open_cache(cache_path)
+    return conn
+
+
+def _purge_cache(cache_path: Path, max_age_days: int = _CACHE_MAX_AGE_DAYS):
+    """清理超过保留期限的缓存条目
+
+    每次分析都会调用，但距上次清理不足 _CACHE_PURGE_INTERVAL 时只做一次查询。
+    """
+    try:
+        conn = _open_cache(cache_path)
+        try:
+            now = time.time()
+            row = conn.execute("SELECT value FROM cache_meta WHERE key = 'last_purge'").fetchone()
+            if row is not None and now - row[0] < _CACHE_PURGE_INTERVAL:
+                return
+            with conn:
+                conn.execute(
+                    "DELETE FROM ast_cache WHERE created < ?",
+                    (now - max_age_days * 86400,)
+                )
+                conn.execute("INSERT OR REPLACE INTO cache_meta VALUES ('last_purge', ?)", (now,))
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"清理缓存失败 {cache_path}: {e}")
+
+
+def _metric_values(metric: ComplexityMetric) -> Tuple[int, ...]:
+    """把指标转换为普通元组存入缓存，使缓存不依赖类所在的模块名（脚本运行时为 __main__）"""
+    return tuple(getattr(metric, f.name) for f in fields(metric))
+
+
+def _cache_lookup(cache_path: Path, digest: bytes) -> Optional[Tuple[ComplexityMetric, List[str], Optional[bytes]]]:
+    """按内容摘要查询缓存"""
+    try:
+        row = _get_cache_connection(cache_path).execute(
+            "SELECT metric, imports, signature FROM ast_cache WHERE hash = ?", (digest,)
+        ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None:
+        return None
+    try:
+        return ComplexityMetric(*pickle.loads(row[0])), pickle.loads(row[1]), row[2]
+    except (pickle.UnpicklingError, AttributeError, TypeError, ValueError, EOFError):
+        return None
+
+
+def _cache_store(cache_path: Path, digest: bytes, metric: ComplexityMetric,
+                 imports: List[str], signature: Optional[bytes]):
+    """写入缓存条目"""
+    try:
+        conn = _get_cache_connection(cache_path)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ast_cache VALUES (?, ?, ?, ?, ?)",
+                (digest, pickle.dumps(_metric_values(metric)), pickle.dumps(imports), signature, time.time())
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+_SKIP_DIRS = frozenset({'__pycache__', 'venv', '.venv', 'node_modules'})
+
+
+def _walk_python_files(directory: str) -> Iterator[str]:
+    """基于 os.scandir 的深度优先遍历，在目录层面剪枝忽略的目录"""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if name in _SKIP_DIRS or name.startswith('.'):
+                continue
+            yield from _walk_python_files(entry.path)
+        elif name.endswith('.py'):
+            yield entry.path
+
+
+def _analyze_file(file_path: str, project_root: str,
+                  cache_path: Optional[Path] = None
+                  ) -> Tuple[str, Optional[ComplexityMetric], Optional[List[str]], Optional[bytes]]:
+    """分析单个文件的复杂度、导入和结构签名（可在工作进程中执行）"""
+    relative_path = os.path.relpath(file_path, project_root)
+    try:
+        data = Path(file_path).read_bytes()
+    except OSError as e:
+        print(f"分析文件失败 {file_path}: {e}")
+        return relative_path, None, None, None
+
+    digest = None
+    if cache_path is not None:
+        digest = hashlib.blake2b(data, digest_size=16, person=_CACHE_VERSION).digest()
+        cached = _cache_lookup(cache_path, digest)
+        if cached is not None:
+            return relative_path, cached[0], cached[1], cached[2]
+
+    try:
+        # ast.parse 直接接受字节，自行处理 BOM 和编码声明
+        tree = ast.parse(data, filename=file_path)
+    except Exception as e:
+        print(f"分析文件失败 {file_path}: {e}")
+        return relative_path, None, None, None
+
+    visitor = ComplexityVisitor()
+    visitor.visit(tree)
+    try:
+        complexity = _calculate_complexity(visitor, data)
+    except Exception as e:
+        print(f"分析文件失败 {file_path}: {e}")
+        complexity = None
+
+    imports = visitor.imports
+    signature = _definition_signature(visitor)
+    if digest is not None and complexity is not None:
+        _cache_store(cache_path, digest, complexity, imports, signature)
+
+    return relative_path, complexity, imports, signature
+
+
+@lru_cache(maxsize=4096)
+def _resolve_relative_import(package_parts: Tuple[str, ...], relative_import: str) -> Optional[str]:
+    """将相对导入解析为点分模块名（同一包内的相同导入会重复出现，结果可缓存）"""
+    depth = len(relative_import) - len(relative_import.lstrip('.'))
+    if depth - 1 > len(package_parts):
+        return None
+
+    base_parts = package_parts[:len(package_parts) - (depth - 1)]
+    remainder = relative_import[depth:]
+    return '.'.join(base_parts + (remainder,)) if remainder else '.'.join(base_parts)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON 序列化回调：直接展开数据类字段，避免 asdict 的递归深拷贝"""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_HTML_REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>SPDX Scanner 代码质量报告</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { background-color: #f5f5f5; padding: 20px; border-radius: 5px; }
+        .section { margin: 20px 0; }
+        .metric { background-color: #e9f7ef; padding: 10px; margin: 10px 0; border-radius: 3px; }
+        .recommendation { background-color: #fff3cd; padding: 10px; margin: 10px 0; border-radius: 3px; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+"""
+
+_HTML_COMPLEXITY_LABELS = (
+    ('low', '低 (1-5)'),
+    ('medium', '中 (6-10)'),
+    ('high', '高 (11-20)'),
+    ('very_high', '很高 (&gt;20)'),
+)
+
+
 class CodeQualityAnalyzer:
     """代码质量分析器"""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
         self.project_root = project_root
-        self.python_files = []
+        self.cache_path = cache_path
+        self.python_files: List[str] = []
         self.dependency_graph: Dict[str, DependencyInfo] = {}
         self.complexity_metrics: Dict[str, ComplexityMetric] = {}
         self.duplicate_patterns: List[Tuple[str, str, float]] = []
+        self._signatures: Dict[bytes, List[str]] = {}
+        self._aggregates_cache: Optional[_Aggregates] = None
+        self._name_index: Dict[str, str] = {}
 
     def analyze(self) -> CodeQualityReport:
         """执行完整的代码质量分析"""
@@ -79,11 +439,12 @@ class CodeQualityAnalyzer:
         # 1. 发现Python文件
         self._discover_python_files()
 
-        # 2. 分析复杂度
-        self._analyze_complexity()
+        # 2. 并行分析每个文件的复杂度和导入
+        self._analyze_files()
 
-        # 3. 分析依赖关系
+        # 3. 分析依赖关系，并按拓扑顺序重排依赖图
         self._analyze_dependencies()
+        self._sort_dependency_graph()
 
         # 4. 检测重复代码
         self._detect_duplicates()
@@ -95,14 +456,15 @@ class CodeQualityAnalyzer:
         recommendations = self._generate_recommendations()
 
         # 7. 生成报告
+        aggregates = self._aggregates
         report = CodeQualityReport(
             timestamp=datetime.now().isoformat(),
             project_path=str(self.project_root),
             file_count=len(self.python_files),
-            total_lines=sum(m.lines_of_code for m in self.complexity_metrics.values()),
-            total_functions=sum(m.function_count for m in self.complexity_metrics.values()),
-            total_classes=sum(m.class_count for m in self.complexity_metrics.values()),
-            average_complexity=sum(m.cyclomatic_complexity for m in self.complexity_metrics.values()) / max(len(self.complexity_metrics), 1),
+            total_lines=aggregates.total_lines,
+            total_functions=aggregates.total_functions,
+            total_classes=aggregates.total_classes,
+            average_complexity=aggregates.complexity_sum / max(len(self.complexity_metrics), 1),
             complexity_distribution=self._get_complexity_distribution(),
             dependency_graph=self.dependency_graph,
             duplicate_files=self.duplicate_patterns,
@@ -114,237 +476,147 @@ class CodeQualityAnalyzer:
 
     def _discover_python_files(self):
         """发现所有Python文件"""
-        patterns = ["**/*.py"]
-        for pattern in patterns:
-            for file_path in self.project_root.rglob(pattern):
-                # 忽略特定目录
-                if any(part.startswith('.') for part in file_path.parts):
-                    continue
-                if 'venv' in file_path.parts or '__pycache__' in file_path.parts:
-                    continue
-                self.python_files.append(file_path)
+        self.python_files.extend(_walk_python_files(str(self.project_root)))
 
         print(f"发现 {len(self.python_files)} 个Python文件")
 
-    def _analyze_complexity(self):
-        """分析代码复杂度"""
-        for file_path in self.python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                tree = ast.parse(content)
-                complexity = self._calculate_complexity(tree)
-                self.complexity_metrics[str(file_path.relative_to(self.project_root))] = complexity
-
-            except Exception as e:
-                print(f"分析文件失败 {file_path}: {e}")
-
-    def _calculate_complexity(self, tree: ast.AST) -> ComplexityMetric:
-        """计算AST的复杂度"""
-        class ComplexityVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.cyclomatic_complexity = 1
-                self.cognitive_complexity = 0
-                self.lines_of_code = 0
-                self.nesting_depth = 0
-                self.max_nesting = 0
-                self.function_count = 0
-                self.class_count = 0
-                self.current_nesting = 0
-
-            def visit_If(self, node):
-                self.cyclomatic_complexity += 1
-                self.cognitive_complexity += 1 + self.current_nesting
-                self.current_nesting += 1
-                self.generic_visit(node)
-                self.current_nesting -= 1
-
-            def visit_While(self, node):
-                self.cyclomatic_complexity += 1
-                self.cognitive_complexity += 1 + self.current_nesting
-                self.current_nesting += 1
-                self.generic_visit(node)
-                self.current_nesting -= 1
-
-            def visit_For(self, node):
-                self.cyclomatic_complexity += 1
-                self.cognitive_complexity += 1 + self.current_nesting
-                self.current_nesting += 1
-                self.generic_visit(node)
-                self.current_nesting -= 1
-
-            def visit_ExceptHandler(self, node):
-                self.cyclomatic_complexity += 1
-                self.cognitive_complexity += 1 + self.current_nesting
-                self.generic_visit(node)
-
-            def visit_With(self, node):
-                self.cognitive_complexity += 1 + self.current_nesting
-                self.generic_visit(node)
-
-            def visit_And(self, node):
-                self.cognitive_complexity += 1
-                self.generic_visit(node)
-
-            def visit_Or(self, node):
-                self.cognitive_complexity += 1
-                self.generic_visit(node)
-
-            def visit_FunctionDef(self, node):
-                self.function_count += 1
-                self.current_nesting += 1
-                self.generic_visit(node)
-                self.current_nesting -= 1
-                self.max_nesting = max(self.max_nesting, self.current_nesting)
-
-            def visit_ClassDef(self, node):
-                self.class_count += 1
-                self.current_nesting += 1
-                self.generic_visit(node)
-                self.current_nesting -= 1
-
-            def generic_visit(self, node):
-                super().generic_visit(node)
-
-        visitor = ComplexityVisitor()
-        visitor.visit(tree)
-
-        return ComplexityMetric(
-            cyclomatic_complexity=visitor.cyclomatic_complexity,
-            cognitive_complexity=visitor.cognitive_complexity,
-            lines_of_code=len([line for line in ast.get_source_segment('').split('\\n') if line.strip()]) if hasattr(ast, 'get_source_segment') else 0,
-            nesting_depth=visitor.max_nesting,
-            function_count=visitor.function_count,
-            class_count=visitor.class_count
-        )
-
-    def _analyze_dependencies(self):
-        """分析依赖关系"""
-        for file_path in self.python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+    def _analyze_files(self):
+        """使用多进程分析所有文件的复杂度和导入"""
+        if self.cache_path is not None:
+            _purge_cache(self.cache_path)
 
-                tree = ast.parse(content)
-                imports = self._extract_imports(tree)
-                relative_path = str(file_path.relative_to(self.project_root))
+        roots = [str(self.project_root)] * len(self.python_files)
+        cache_paths = [self.cache_path] * len(self.python_files)
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_analyze_file, self.python_files, roots, cache_paths, chunksize=16))
 
+        for relative_path, complexity, imports, signature in results:
+            if complexity is not None:
+                self.complexity_metrics[relative_path] = complexity
+            if imports is not None:
                 self.dependency_graph[relative_path] = DependencyInfo(
                     module_name=relative_path,
                     imports=imports,
-                    imported_by=[],  # 将在下一步填充
+                    imported_by=[],  # 将在依赖分析中填充
                     external_imports=set(),
                     internal_imports=set()
                 )
+            if signature is not None:
+                self._signatures.setdefault(signature, []).append(relative_path)
+
+    def _build_name_index(self):
+        """建立模块点分名称到依赖图键（相对路径）的索引"""
+        for relative_path in self.dependency_graph:
+            parts = relative_path[:-len('.py')].replace(os.sep, '/').split('/')
+            if parts[-1] == '__init__':
+                parts.pop()
+            if not parts:
+                continue
+            self._name_index['.'.join(parts)] = relative_path
+            # src 布局下的包以不带 src 前缀的名称导入
+            if parts[0] == 'src' and len(parts) > 1:
+                self._name_index.setdefault('.'.join(parts[1:]), relative_path)
 
-            except Exception as e:
-                print(f"分析依赖失败 {file_path}: {e}")
+    def _analyze_dependencies(self):
+        """分析依赖关系（需要完整的依赖图，串行执行）"""
+        self._build_name_index()
 
         # 填充导入者和分类导入
         for module, info in self.dependency_graph.items():
+            package_parts = tuple(module.replace(os.sep, '/').split('/')[:-1])
             for imp in info.imports:
                 if imp.startswith('.'):
                     # 相对导入
-                    internal_import = self._resolve_relative_import(module, imp)
-                    if internal_import and internal_import in self.dependency_graph:
-                        info.internal_imports.add(internal_import)
-                        self.dependency_graph[internal_import].imported_by.append(module)
+                    target = self._name_index.get(_resolve_relative_import(package_parts, imp))
+                else:
+                    target = self._name_index.get(imp)
+
+                if target is not None:
+                    # 项目内模块导入（同一模块多次导入只记录一次）
+                    if target not in info.internal_imports:
+                        info.internal_imports.add(target)
+                        self.dependency_graph[target].imported_by.append(module)
                 elif imp.startswith('spdx_scanner'):
-                    # 内部模块导入
+                    # 无法定位到文件的内部模块导入
                     info.internal_imports.add(imp)
-                    if imp in self.dependency_graph:
-                        self.dependency_graph[imp].imported_by.append(module)
-                else:
+                elif not imp.startswith('.'):
                     # 外部导入
                     info.external_imports.add(imp)
 
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """提取导入语句"""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-        return imports
-
-    def _resolve_relative_import(self, current_module: str, relative_import: str) -> str:
-        """解析相对导入"""
-        # 简化的相对导入解析
-        if relative_import.startswith('.'):
-            depth = len(relative_import) - len(relative_import.lstrip('.'))
-            module_parts = current_module.split('/')
-
-            if depth > len(module_parts):
-                return None
-
-            base_parts = module_parts[:-depth] if depth > 0 else module_parts
-            import_parts = relative_import.lstrip('.').split('.')
-
-            return '/'.join(base_parts + import_parts) + '.py'
-        return relative_import
+    def _sort_dependency_graph(self):
+        """按拓扑顺序（被依赖的模块在前）重建依赖图，使后续遍历沿依赖关系进行"""
+        graph = self.dependency_graph
+        pending = {
+            module: sum(1 for dep in info.internal_imports if dep in graph and dep != module)
+            for module, info in graph.items()
+        }
+        queue = deque(module for module, count in pending.items() if count == 0)
+        order = []
+        while queue:
+            module = queue.popleft()
+            order.append(module)
+            for importer in graph[module].imported_by:
+                if importer == module:
+                    continue
+                pending[importer] -= 1
+                if pending[importer] == 0:
+                    queue.append(importer)
+
+        if len(order) < len(graph):
+            # 存在循环依赖时，剩余模块保持原有顺序追加
+            seen = set(order)
+            order.extend(module for module in graph if module not in seen)
+
+        self.dependency_graph = {module: graph[module] for module in order}
 
     def _detect_duplicates(self):
-        """检测重复代码"""
-        file_contents = {}
-
-        # 收集文件内容
-        for file_path in self.python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # 简单的重复检测 - 基于函数和类定义
-                functions = re.findall(r'^\\s*def\\s+(\\w+)', content, re.MULTILINE)
-                classes = re.findall(r'^\\s*class\\s+(\\w+)', content, re.MULTILINE)
-
-                signature = ','.join(sorted(functions + classes))
-                if signature:
-                    if signature not in file_contents:
-                        file_contents[signature] = []
-                    file_contents[signature].append(str(file_path.relative_to(self.project_root)))
-
-            except Exception:
-                continue
+        """检测重复代码（基于AST中函数和类定义的签名）"""
+        # 每个签名只记录一对代表文件，并只保留相似度最高的若干条
+        candidates = (
+            # 计算相似度（简化版本）
+            (files[0], files[1], min(len(files) / 5.0, 1.0))
+            for files in self._signatures.values()
+            if len(files) > 1
+        )
+        self.duplicate_patterns.extend(
+            heapq.nlargest(_MAX_DUPLICATE_PATTERNS, candidates, key=lambda pattern: pattern[2])
+        )
 
-        # 识别重复
-        for signature, files in file_contents.items():
-            if len(files) > 1:
-                # 计算相似度（简化版本）
-                similarity = min(len(files) / 5.0, 1.0)  # 简单的相似度计算
-                self.duplicate_patterns.append((files[0], files[1], similarity))
+    @property
+    def _aggregates(self) -> _Aggregates:
+        """单次遍历汇总所有复杂度指标（首次访问后缓存）"""
+        if self._aggregates_cache is None:
+            total_lines = total_functions = total_classes = complexity_sum = 0
+            counts = [0] * len(_COMPLEXITY_BUCKETS)
+            for metric in self.complexity_metrics.values():
+                complexity = metric.cyclomatic_complexity
+                total_lines += metric.lines_of_code
+                total_functions += metric.function_count
+                total_classes += metric.class_count
+                complexity_sum += complexity
+                counts[bisect.bisect_left(_COMPLEXITY_BOUNDS, complexity)] += 1
+
+            self._aggregates_cache = _Aggregates(
+                total_lines=total_lines,
+                total_functions=total_functions,
+                total_classes=total_classes,
+                complexity_sum=complexity_sum,
+                distribution=dict(zip(_COMPLEXITY_BUCKETS, counts)),
+                # 复杂度 > 10 即 high 与 very_high 两个区间
+                high_complexity_count=counts[2] + counts[3]
+            )
+        return self._aggregates_cache
 
     def _get_complexity_distribution(self) -> Dict[str, int]:
         """获取复杂度分布"""
-        distribution = {
-            'low': 0,      # 1-5
-            'medium': 0,   # 6-10
-            'high': 0,     # 11-20
-            'very_high': 0 # >20
-        }
-
-        for metric in self.complexity_metrics.values():
-            complexity = metric.cyclomatic_complexity
-            if complexity <= 5:
-                distribution['low'] += 1
-            elif complexity <= 10:
-                distribution['medium'] += 1
-            elif complexity <= 20:
-                distribution['high'] += 1
-            else:
-                distribution['very_high'] += 1
-
-        return distribution
+        return dict(self._aggregates.distribution)
 
     def _calculate_technical_debt(self) -> float:
         """计算技术债务评分 (0-10, 10为最高债务)"""
         debt_score = 0.0
 
         # 复杂度债务
-        high_complexity = sum(1 for m in self.complexity_metrics.values() if m.cyclomatic_complexity > 10)
+        high_complexity = self._aggregates.high_complexity_count
         if high_complexity > 0:
             debt_score += min(high_complexity / len(self.complexity_metrics) * 10, 3)
 
@@ -392,8 +664,12 @@ class CodeQualityAnalyzer:
     def export_report(self, report: CodeQualityReport, output_format: str = 'console', output_file: str = None):
         """导出报告"""
         if output_format == 'json':
-            with open(output_file or 'code_quality_report.json', 'w') as f:
-                json.dump(asdict(report), f, indent=2)
+            if orjson is not None:
+                with open(output_file or 'code_quality_report.json', 'wb') as f:
+                    f.write(orjson.dumps(report, default=_json_default, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file or 'code_quality_report.json', 'w', encoding='utf-8') as f:
+                    json.dump(report, f, default=_json_default, indent=2, ensure_ascii=False)
             print(f"报告已导出到: {output_file or 'code_quality_report.json'}")
 
         elif output_format == 'html':
@@ -443,28 +719,16 @@ class CodeQualityAnalyzer:
         print("="*60)
 
     def _generate_html_report(self, report: CodeQualityReport, output_file: str = None):
-        """生成HTML报告"""
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>SPDX Scanner 代码质量报告</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        .header {{ background-color: #f5f5f5; padding: 20px; border-radius: 5px; }}
-        .section {{ margin: 20px 0; }}
-        .metric {{ background-color: #e9f7ef; padding: 10px; margin: 10px 0; border-radius: 3px; }}
-        .recommendation {{ background-color: #fff3cd; padding: 10px; margin: 10px 0; border-radius: 3px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <div class="header">
+        """生成HTML报告（分段写入文件，避免在内存中拼接完整文档）"""
+        output_file = output_file or 'code_quality_report.html'
+        distribution = report.complexity_distribution
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(_HTML_REPORT_HEAD)
+            f.write(f"""    <div class="header">
         <h1>SPDX Scanner 代码质量分析报告</h1>
-        <p>生成时间: {report.timestamp}</p>
-        <p>项目路径: {report.project_path}</p>
+        <p>生成时间: {html.escape(report.timestamp)}</p>
+        <p>项目路径: {html.escape(report.project_path)}</p>
     </div>
 
     <div class="section">
@@ -484,25 +748,27 @@ class CodeQualityAnalyzer:
         <h2>复杂度分布</h2>
         <table>
             <tr><th>复杂度等级</th><th>文件数量</th></tr>
-            <tr><td>低 (1-5)</td><td>{report.complexity_distribution['low']}</td></tr>
-            <tr><td>中 (6-10)</td><td>{report.complexity_distribution['medium']}</td></tr>
-            <tr><td>高 (11-20)</td><td>{report.complexity_distribution['high']}</td></tr>
-            <tr><td>很高 (>20)</td><td>{report.complexity_distribution['very_high']}</td></tr>
-        </table>
+""")
+            f.writelines(
+                f"            <tr><td>{label}</td><td>{distribution[key]}</td></tr>\n"
+                for key, label in _HTML_COMPLEXITY_LABELS
+            )
+            f.write("""        </table>
     </div>
 
     <div class="section">
         <h2>改进建议</h2>
-        {''.join(f'<div class="recommendation">{rec}</div>' for rec in report.recommendations)}
-    </div>
+""")
+            f.writelines(
+                f'        <div class="recommendation">{html.escape(rec)}</div>\n'
+                for rec in report.recommendations
+            )
+            f.write("""    </div>
 </body>
 </html>
-        """
-
-        with open(output_file or 'code_quality_report.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
+""")
 
-        print(f"HTML报告已生成: {output_file or 'code_quality_report.html'}")
+        print(f"HTML报告已生成: {output_file}")
 
 
 def main():
@@ -511,6 +777,7 @@ def main():
     parser.add_argument("--output", choices=['json', 'html', 'console'], default='console',
                        help="输出格式 (默认: console)")
     parser.add_argument("--output-file", help="输出文件路径")
+    parser.add_argument("--no-cache", action="store_true", help="不使用持久化分析缓存")
     parser.add_argument("--verbose", "-v", action="store_true", help="详细输出")
 
     args = parser.parse_args()
@@ -519,7 +786,7 @@ def main():
     project_root = Path.cwd()
 
     # 创建分析器
-    analyzer = CodeQualityAnalyzer(project_root)
+    analyzer = CodeQualityAnalyzer(project_root, cache_path=None if args.no_cache else DEFAULT_CACHE_PATH)
 
     # 执行分析
     report = analyzer.analyze()
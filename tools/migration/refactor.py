@@ -20,13 +20,189 @@ import os
 import shutil
 import argparse
 import json
+import time
 import logging
+import logging.handlers
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Iterator
+from dataclasses import dataclass, fields
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    # 未安装 orjson 时使用标准库 json
+    orjson = None
+
+
+# 需要清理的缓存目录名、目录后缀和文件后缀
+_CACHE_DIR_NAMES = frozenset({"__pycache__", ".pytest_cache"})
+_CACHE_DIR_SUFFIXES = (".egg-info",)
+_CACHE_FILE_SUFFIXES = (".pyc", ".pyo")
+
+
+def _iter_cache_entries(path) -> Iterator[os.DirEntry]:
+    """单次遍历找出所有缓存文件和目录，匹配的目录不再深入"""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            if entry.name in _CACHE_DIR_NAMES or entry.name.endswith(_CACHE_DIR_SUFFIXES):
+                yield entry
+            else:
+                yield from _iter_cache_entries(entry.path)
+        elif entry.name.endswith(_CACHE_FILE_SUFFIXES):
+            yield entry
+
+
+# 重构过程中会被原地改写的文件，备份时必须复制而不能硬链接
+_REWRITTEN_FILES = frozenset({
+    ".gitignore", ".gitignore_improved", "refactor_report.json", ".refactor_negative_cache",
+})
+
+
+# .gitignore 内容：改进版在基础版之后追加额外规则
+_GITIGNORE_BASE = b"""# Python
+__pycache__/
+*.py[cod]
+*$py.class
+*.so
+.Python
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+MANIFEST
+
+# PyInstaller
+*.manifest
+*.spec
+
+# Unit test / coverage reports
+htmlcov/
+.tox/
+.nox/
+.coverage
+.coverage.*
+.cache
+nosetests.xml
+coverage.xml
+*.cover
+.hypothesis/
+.pytest_cache/
+
+# Jupyter Notebook
+.ipynb_checkpoints
+
+# Environments
+.env
+.venv
+env/
+venv/
+ENV/
+env.bak/
+venv.bak/
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
+
+# Logs
+logs/
+*.log
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Editor specific
+.cursor/
+.cursorindexingignore
+
+# Project specific
+refactor_backup_*
+refactor.log
+.refactor_negative_cache
+"""
+
+_GITIGNORE_EXTRA = b"""
+# Development tools
+.mypy_cache/
+.dmypy.json
+dmypy.json
+
+# Pyre type checker
+.pyre/
+
+# profiling data
+.prof
+
+# Sphinx documentation
+docs/_build/
+
+# Backup files
+*.bak
+*.backup
+*~
+
+# Temporary files
+*.tmp
+*.temp
+"""
+
+_GITIGNORE_IMPROVED = _GITIGNORE_BASE + _GITIGNORE_EXTRA
+
+
+def _write_bytes(path, data: bytes):
+    """直接通过文件描述符写入字节内容，绕过文本 I/O 层"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """优先用硬链接备份文件，跨设备或不支持硬链接时退回到复制
+
+    目标已是源文件的硬链接（如整体备份已包含该文件）时直接返回。
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    if os.path.basename(src) not in _REWRITTEN_FILES:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
 
 class MigrationStatus(Enum):
     """迁移状态枚举"""
@@ -37,7 +213,21 @@ class MigrationStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+def _with_slots(cls):
+    """为数据类重建带 __slots__ 的版本（等价于 Python 3.10+ 的 dataclass(slots=True)）"""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # 移除作为类属性保存的默认值，避免与槽描述符冲突
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_with_slots
+@dataclass(frozen=True)
 class FileMigration:
     """文件迁移配置"""
     source: str
@@ -47,6 +237,109 @@ class FileMigration:
     backup_required: bool = False
 
 
+# 迁移规则
+_MIGRATION_RULES: Tuple[FileMigration, ...] = (
+    # 测试文件迁移
+    FileMigration(
+        source="integration_test.py",
+        destination="tests/integration/test_integration_e2e.py",
+        description="集成测试文件迁移"
+    ),
+    FileMigration(
+        source="simple_validation_test.py",
+        destination="tests/integration/test_simple_validation.py",
+        description="简单验证测试迁移"
+    ),
+    FileMigration(
+        source="test_coverage.py",
+        destination="tests/tools/test_coverage.py",
+        description="覆盖率测试工具迁移"
+    ),
+    FileMigration(
+        source="test_examples.py",
+        destination="tests/tools/test_examples.py",
+        description="示例测试迁移"
+    ),
+    FileMigration(
+        source="test_extensions_config.py",
+        destination="tests/tools/test_extensions_config.py",
+        description="扩展配置测试迁移"
+    ),
+    FileMigration(
+        source="test_validation.py",
+        destination="tests/test_validation_complete.py",
+        description="验证测试迁移"
+    ),
+    FileMigration(
+        source="validation_test.py",
+        destination="tests/test_validation_helper.py",
+        description="验证辅助测试迁移"
+    ),
+    FileMigration(
+        source="validation_example.py",
+        destination="tests/examples/test_validation_examples.py",
+        description="验证示例迁移"
+    ),
+    FileMigration(
+        source="validation_summary.py",
+        destination="tests/tools/test_summary.py",
+        description="摘要测试迁移"
+    ),
+
+    # 文档文件迁移
+    FileMigration(
+        source="BUILD_VALIDATION.md",
+        destination="docs/development/build-validation.md",
+        description="构建验证文档迁移"
+    ),
+    FileMigration(
+        source="PRODUCTION_DEPLOYMENT.md",
+        destination="docs/deployment/production-deployment.md",
+        description="生产部署文档迁移"
+    ),
+    FileMigration(
+        source="RELEASE_PREPARATION.md",
+        destination="docs/development/release-preparation.md",
+        description="发布准备文档迁移"
+    ),
+    FileMigration(
+        source="EXAMPLES_VERIFICATION.md",
+        destination="docs/testing/examples-verification.md",
+        description="示例验证文档迁移"
+    ),
+    FileMigration(
+        source="EXTENSIONS_CONFIG.md",
+        destination="docs/testing/extensions-config.md",
+        description="扩展配置文档迁移"
+    ),
+    FileMigration(
+        source="README_VALIDATION.md",
+        destination="docs/testing/README-validation.md",
+        description="README验证文档迁移"
+    ),
+    FileMigration(
+        source="VERIFICATION_REPORT.md",
+        destination="docs/testing/verification-report.md",
+        description="验证报告文档迁移"
+    ),
+
+    # 特殊目录处理
+    FileMigration(
+        source=".logs",
+        destination="logs",
+        description="日志目录标准化",
+        required=False
+    ),
+    FileMigration(
+        source="task",
+        destination="scripts/task_management",
+        description="任务管理目录迁移",
+        required=False
+    ),
+)
+
+
+@_with_slots
 @dataclass
 class MigrationResult:
     """迁移结果"""
@@ -65,8 +358,11 @@ class ProjectRefactor:
         self.backup = backup
         self.verbose = verbose
         self.project_root = Path.cwd()
-        self.migration_results: List[MigrationResult] = []
+        self.migration_results: List[Optional[MigrationResult]] = []
         self.backup_dir = self.project_root / "refactor_backup"
+        self.negative_cache_path = self.project_root / ".refactor_negative_cache"
+        self._negative_cache: Dict[str, int] = {}
+        self._root_mtime = 0
 
         # 设置日志
         self._setup_logging()
@@ -77,138 +373,83 @@ class ProjectRefactor:
     def _setup_logging(self):
         """设置日志配置"""
         log_level = logging.DEBUG if self.verbose else logging.INFO
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+
+        # 日志文件的记录先缓存在内存中，遇到错误或运行结束时再批量写入
+        file_handler = logging.FileHandler('refactor.log')
+        file_handler.setFormatter(logging.Formatter(log_format))
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=4096,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
         logging.basicConfig(
             level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler('refactor.log'),
+                self._log_buffer,
                 logging.StreamHandler()
             ]
         )
         self.logger = logging.getLogger(__name__)
 
-    def _define_migration_rules(self) -> List[FileMigration]:
-        """定义迁移规则"""
-        return [
-            # 测试文件迁移
-            FileMigration(
-                source="integration_test.py",
-                destination="tests/integration/test_integration_e2e.py",
-                description="集成测试文件迁移"
-            ),
-            FileMigration(
-                source="simple_validation_test.py",
-                destination="tests/integration/test_simple_validation.py",
-                description="简单验证测试迁移"
-            ),
-            FileMigration(
-                source="test_coverage.py",
-                destination="tests/tools/test_coverage.py",
-                description="覆盖率测试工具迁移"
-            ),
-            FileMigration(
-                source="test_examples.py",
-                destination="tests/tools/test_examples.py",
-                description="示例测试迁移"
-            ),
-            FileMigration(
-                source="test_extensions_config.py",
-                destination="tests/tools/test_extensions_config.py",
-                description="扩展配置测试迁移"
-            ),
-            FileMigration(
-                source="test_validation.py",
-                destination="tests/test_validation_complete.py",
-                description="验证测试迁移"
-            ),
-            FileMigration(
-                source="validation_test.py",
-                destination="tests/test_validation_helper.py",
-                description="验证辅助测试迁移"
-            ),
-            FileMigration(
-                source="validation_example.py",
-                destination="tests/examples/test_validation_examples.py",
-                description="验证示例迁移"
-            ),
-            FileMigration(
-                source="validation_summary.py",
-                destination="tests/tools/test_summary.py",
-                description="摘要测试迁移"
-            ),
-
-            # 文档文件迁移
-            FileMigration(
-                source="BUILD_VALIDATION.md",
-                destination="docs/development/build-validation.md",
-                description="构建验证文档迁移"
-            ),
-            FileMigration(
-                source="PRODUCTION_DEPLOYMENT.md",
-                destination="docs/deployment/production-deployment.md",
-                description="生产部署文档迁移"
-            ),
-            FileMigration(
-                source="RELEASE_PREPARATION.md",
-                destination="docs/development/release-preparation.md",
-                description="发布准备文档迁移"
-            ),
-            FileMigration(
-                source="EXAMPLES_VERIFICATION.md",
-                destination="docs/testing/examples-verification.md",
-                description="示例验证文档迁移"
-            ),
-            FileMigration(
-                source="EXTENSIONS_CONFIG.md",
-                destination="docs/testing/extensions-config.md",
-                description="扩展配置文档迁移"
-            ),
-            FileMigration(
-                source="README_VALIDATION.md",
-                destination="docs/testing/README-validation.md",
-                description="README验证文档迁移"
-            ),
-            FileMigration(
-                source="VERIFICATION_REPORT.md",
-                destination="docs/testing/verification-report.md",
-                description="验证报告文档迁移"
-            ),
-
-            # 特殊目录处理
-            FileMigration(
-                source=".logs",
-                destination="logs",
-                description="日志目录标准化",
-                required=False
-            ),
-            FileMigration(
-                source="task",
-                destination="scripts/task_management",
-                description="任务管理目录迁移",
-                required=False
-            ),
-        ]
+    def _define_migration_rules(self) -> Tuple[FileMigration, ...]:
+        """定义迁移规则（规则为不可变数据，在模块加载时构建一次）"""
+        return _MIGRATION_RULES
 
     def run(self) -> bool:
         """执行重构"""
         self.logger.info("开始SPDX Scanner项目重构...")
+        self._load_negative_cache()
 
-        # 1. 预处理
-        if not self._preprocess():
-            return False
+        try:
+            # 1. 预处理
+            if not self._preprocess():
+                return False
 
-        # 2. 执行迁移
-        if not self._execute_migrations():
-            return False
+            # 2. 执行迁移
+            if not self._execute_migrations():
+                return False
 
-        # 3. 后处理
-        if not self._postprocess():
-            return False
+            # 3. 后处理
+            if not self._postprocess():
+                return False
 
-        # 4. 生成报告
-        self._generate_report()
+            # 4. 生成报告
+            self._generate_report()
 
-        return True
+            return True
+
+        finally:
+            if not self.dry_run:
+                self._save_negative_cache()
+            self._log_buffer.flush()
+
+    def _load_negative_cache(self):
+        """加载上次运行记录的缺失源文件
+
+        所有迁移源都位于项目根目录下，根目录的 mtime 未变化说明这些条目没有增删，
+        缓存中的缺失记录仍然有效。
+        """
+        try:
+            self._root_mtime = os.stat(self.project_root).st_mtime_ns
+            self._negative_cache = json.loads(self.negative_cache_path.read_bytes())
+        except (OSError, ValueError):
+            self._negative_cache = {}
+
+    def _save_negative_cache(self):
+        """保存本次运行确认缺失的源文件，并记录当前根目录 mtime"""
+        missing = [r.source for r in self.migration_results
+                   if r is not None and r.status == MigrationStatus.SKIPPED]
+        try:
+            # 首次创建缓存文件会改变根目录 mtime，因此先写入再读取 mtime
+            if not self.negative_cache_path.exists():
+                _write_bytes(self.negative_cache_path, b"{}")
+            root_mtime = os.stat(self.project_root).st_mtime_ns
+            blob = json.dumps({source: root_mtime for source in missing}).encode('utf-8')
+            _write_bytes(self.negative_cache_path, blob)
+        except OSError as e:
+            self.logger.warning(f"保存缺失文件缓存失败: {e}")
 
     def _preprocess(self) -> bool:
         """预处理阶段"""
@@ -262,15 +503,19 @@ class ProjectRefactor:
             ".github/workflows"
         ]
 
-        for directory in directories:
+        # 只创建叶子目录：mkdir(parents=True) 会顺带创建所有上级目录
+        ancestors = {str(parent) for directory in directories for parent in Path(directory).parents}
+        leaves = [directory for directory in directories if directory not in ancestors]
+
+        for directory in leaves:
             dir_path = self.project_root / directory
             try:
-                if not dir_path.exists():
-                    if self.dry_run:
+                if self.dry_run:
+                    if not dir_path.exists():
                         self.logger.info(f"[DRY RUN] 创建目录: {directory}")
-                    else:
-                        dir_path.mkdir(parents=True, exist_ok=True)
-                        self.logger.info(f"创建目录: {directory}")
+                else:
+                    dir_path.mkdir(parents=True, exist_ok=True)
+                    self.logger.debug(f"确保目录存在: {directory}")
 
             except Exception as e:
                 self.logger.error(f"创建目录失败 {directory}: {e}")
@@ -279,21 +524,28 @@ class ProjectRefactor:
         return True
 
     def _create_backup(self) -> bool:
-        """创建备份"""
+        """创建备份
+
+        备份中的文件是原文件的硬链接：迁移使用 shutil.move（重命名），不会影响
+        备份内容；但之后不能原地编辑这些文件，否则备份会随之改变。
+        """
         try:
             if self.dry_run:
                 self.logger.info(f"[DRY RUN] 创建备份到: {self.backup_dir}")
                 return True
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             backup_path = self.project_root / f"refactor_backup_{timestamp}"
 
             self.logger.info(f"创建备份: {backup_path}")
             shutil.copytree(self.project_root, backup_path,
                           ignore=shutil.ignore_patterns(
                               '.git', '__pycache__', '*.pyc',
-                              '.pytest_cache', 'refactor.log'
-                          ))
+                              '.pytest_cache', 'refactor.log',
+                              '.refactor_negative_cache',
+                              'refactor_backup_*'
+                          ),
+                          copy_function=_link_or_copy)
 
             self.backup_dir = backup_path
             return True
@@ -303,36 +555,29 @@ class ProjectRefactor:
             return False
 
     def _clean_cache_files(self) -> bool:
-        """清理缓存文件"""
-        patterns_to_clean = [
-            "__pycache__",
-            "*.pyc",
-            "*.pyo",
-            ".pytest_cache",
-            "*.egg-info"
-        ]
+        """清理缓存文件（__pycache__、*.pyc、*.pyo、.pytest_cache、*.egg-info）"""
+        removed = 0
+        failed = 0
+
+        for entry in _iter_cache_entries(self.project_root):
+            if self.dry_run:
+                self.logger.info(f"[DRY RUN] 清理缓存文件: {entry.path}")
+                continue
 
-        for pattern in patterns_to_clean:
             try:
-                if self.dry_run:
-                    self.logger.info(f"[DRY RUN] 清理缓存文件: {pattern}")
-                    continue
-
-                # 使用find命令清理
-                if pattern == "__pycache__":
-                    result = os.system(f"find {self.project_root} -type d -name '__pycache__' -exec rm -rf {{}} + 2>/dev/null")
-                elif pattern in ["*.pyc", "*.pyo"]:
-                    result = os.system(f"find {self.project_root} -name '{pattern}' -delete 2>/dev/null")
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
                 else:
-                    result = os.system(f"find {self.project_root} -name '{pattern}' -type d -exec rm -rf {{}} + 2>/dev/null")
+                    os.unlink(entry.path)
+                removed += 1
+            except OSError as e:
+                failed += 1
+                self.logger.warning(f"清理 {entry.path} 时出错: {e}")
 
-                if result == 0:
-                    self.logger.info(f"清理完成: {pattern}")
-                else:
-                    self.logger.warning(f"部分清理失败: {pattern}")
-
-            except Exception as e:
-                self.logger.warning(f"清理 {pattern} 时出错: {e}")
+        if not self.dry_run:
+            if failed:
+                self.logger.warning(f"部分清理失败: {failed} 项")
+            self.logger.info(f"清理完成: 删除 {removed} 项")
 
         return True
 
@@ -340,67 +585,85 @@ class ProjectRefactor:
         """执行文件迁移"""
         self.logger.info("执行文件迁移...")
 
+        # 各迁移的源和目标互不相同，可在线程池中并发执行文件系统操作
+        # 结果按规则序号写入预分配的槽位，每个槽位只由一个线程写入，无需加锁
+        self.migration_results = [None] * len(self.migration_rules)
         success_count = 0
-        for migration in self.migration_rules:
-            if self._execute_single_migration(migration):
-                success_count += 1
-            else:
-                if migration.required:
-                    self.logger.error(f"必需迁移失败: {migration.source}")
-                    return False
+        max_workers = max(1, min(16, len(self.migration_rules)))
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._execute_single_migration, migration, index): migration
+                    for index, migration in enumerate(self.migration_rules)
+                }
+                for future in as_completed(futures):
+                    migration = futures[future]
+                    if future.result():
+                        success_count += 1
+                    elif migration.required:
+                        self.logger.error(f"必需迁移失败: {migration.source}")
+                        for pending in futures:
+                            pending.cancel()
+                        return False
+        finally:
+            # 提前中止时被取消的迁移没有结果，去掉空槽位
+            self.migration_results = [r for r in self.migration_results if r is not None]
 
         self.logger.info(f"迁移完成: {success_count}/{len(self.migration_rules)}")
         return True
 
-    def _execute_single_migration(self, migration: FileMigration) -> bool:
+    def _execute_single_migration(self, migration: FileMigration, index: int) -> bool:
         """执行单个文件迁移"""
         source_path = self.project_root / migration.source
         dest_path = self.project_root / migration.destination
 
         try:
-            # 检查源文件是否存在
-            if not source_path.exists():
+            # 检查源文件是否存在：根目录未变化时直接使用缓存的缺失记录，否则单次 lstat
+            try:
+                if self._negative_cache.get(migration.source) == self._root_mtime:
+                    raise FileNotFoundError(migration.source)
+                os.lstat(source_path)
+            except FileNotFoundError:
                 message = f"源文件不存在: {migration.source}"
-                self._record_migration_result(migration, MigrationStatus.SKIPPED, message)
+                self._record_migration_result(index, migration, MigrationStatus.SKIPPED, message)
                 self.logger.warning(message)
                 return not migration.required
 
-            # 检查目标目录是否存在
-            if not dest_path.parent.exists():
-                if not self.dry_run:
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
             # 执行迁移
             if self.dry_run:
                 message = f"[DRY RUN] 迁移 {migration.source} -> {migration.destination}"
                 self.logger.info(message)
-                self._record_migration_result(migration, MigrationStatus.COMPLETED, message)
+                self._record_migration_result(index, migration, MigrationStatus.COMPLETED, message)
                 return True
 
+            # 确保目标目录存在（exist_ok 使预先检查变得多余）
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
             # 创建备份（如果需要）
             backup_path = None
             if migration.backup_required and self.backup:
                 backup_path = self.backup_dir / migration.source
-                shutil.copy2(source_path, backup_path)
+                # 迁移是重命名操作，硬链接即可保留原文件内容
+                _link_or_copy(str(source_path), str(backup_path))
 
-            # 移动文件
-            if source_path.is_file():
-                shutil.move(str(source_path), str(dest_path))
-            else:
+            # 移动文件或目录：同一文件系统内直接原子重命名，失败时（如跨文件系统）退回 shutil.move
+            try:
+                os.replace(source_path, dest_path)
+            except OSError:
                 shutil.move(str(source_path), str(dest_path))
 
             message = f"迁移完成: {migration.source} -> {migration.destination}"
             self.logger.info(message)
-            self._record_migration_result(migration, MigrationStatus.COMPLETED, message, str(backup_path))
+            self._record_migration_result(index, migration, MigrationStatus.COMPLETED, message, str(backup_path))
             return True
 
         except Exception as e:
             message = f"迁移失败 {migration.source}: {e}"
             self.logger.error(message)
-            self._record_migration_result(migration, MigrationStatus.FAILED, message)
+            self._record_migration_result(index, migration, MigrationStatus.FAILED, message)
             return False
 
-    def _record_migration_result(self, migration: FileMigration, status: MigrationStatus,
+    def _record_migration_result(self, index: int, migration: FileMigration, status: MigrationStatus,
                                message: str, backup_path: Optional[str] = None):
         """记录迁移结果"""
         result = MigrationResult(
@@ -410,7 +673,7 @@ class ProjectRefactor:
             message=message,
             backup_path=backup_path
         )
-        self.migration_results.append(result)
+        self.migration_results[index] = result
 
     def _postprocess(self) -> bool:
         """后处理阶段"""
@@ -433,90 +696,13 @@ class ProjectRefactor:
 
     def _update_gitignore(self) -> bool:
         """更新.gitignore文件"""
-        gitignore_content = """# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-MANIFEST
-
-# PyInstaller
-*.manifest
-*.spec
-
-# Unit test / coverage reports
-htmlcov/
-.tox/
-.nox/
-.coverage
-.coverage.*
-.cache
-nosetests.xml
-coverage.xml
-*.cover
-.hypothesis/
-.pytest_cache/
-
-# Jupyter Notebook
-.ipynb_checkpoints
-
-# Environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# Logs
-logs/
-*.log
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Editor specific
-.cursor/
-.cursorindexingignore
-
-# Project specific
-refactor_backup_*
-refactor.log
-"""
-
         try:
             gitignore_path = self.project_root / ".gitignore"
             if self.dry_run:
                 self.logger.info(f"[DRY RUN] 更新 .gitignore")
                 return True
 
-            with open(gitignore_path, 'w', encoding='utf-8') as f:
-                f.write(gitignore_content)
+            _write_bytes(gitignore_path, _GITIGNORE_BASE)
 
             self.logger.info("更新 .gitignore 完成")
             return True
@@ -527,109 +713,9 @@ refactor.log
 
     def _generate_improved_gitignore(self) -> bool:
         """生成改进的.gitignore文件"""
-        improved_gitignore = """# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-MANIFEST
-
-# PyInstaller
-*.manifest
-*.spec
-
-# Unit test / coverage reports
-htmlcov/
-.tox/
-.nox/
-.coverage
-.coverage.*
-.cache
-nosetests.xml
-coverage.xml
-*.cover
-.hypothesis/
-.pytest_cache/
-
-# Jupyter Notebook
-.ipynb_checkpoints
-
-# Environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# Logs
-logs/
-*.log
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Editor specific
-.cursor/
-.cursorindexingignore
-
-# Project specific
-refactor_backup_*
-refactor.log
-
-# Development tools
-.mypy_cache/
-.dmypy.json
-dmypy.json
-
-# Pyre type checker
-.pyre/
-
-# profiling data
-.prof
-
-# Sphinx documentation
-docs/_build/
-
-# Backup files
-*.bak
-*.backup
-*~
-
-# Temporary files
-*.tmp
-*.temp
-"""
-
         try:
             improved_path = self.project_root / ".gitignore_improved"
-            with open(improved_path, 'w', encoding='utf-8') as f:
-                f.write(improved_gitignore)
+            _write_bytes(improved_path, _GITIGNORE_IMPROVED)
 
             self.logger.info("生成改进的 .gitignore 文件: .gitignore_improved")
             return True
@@ -644,13 +730,14 @@ docs/_build/
 
         # 统计结果
         total = len(self.migration_results)
-        completed = sum(1 for r in self.migration_results if r.status == MigrationStatus.COMPLETED)
-        failed = sum(1 for r in self.migration_results if r.status == MigrationStatus.FAILED)
-        skipped = sum(1 for r in self.migration_results if r.status == MigrationStatus.SKIPPED)
+        counts = Counter(r.status for r in self.migration_results)
+        completed = counts[MigrationStatus.COMPLETED]
+        failed = counts[MigrationStatus.FAILED]
+        skipped = counts[MigrationStatus.SKIPPED]
 
         # 生成报告
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
             "summary": {
                 "total_migrations": total,
                 "completed": completed,
@@ -674,8 +761,11 @@ docs/_build/
         # 保存报告
         report_path = self.project_root / "refactor_report.json"
         try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                blob = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            else:
+                blob = json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+            _write_bytes(report_path, blob)
 
             self.logger.info(f"重构报告已生成: {report_path}")
 
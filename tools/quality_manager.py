@@ -5,32 +5,38 @@ SPDX Scanner 质量管理工具
 执行全面的代码质量检查，确保项目维护在高质量标准。
 """
 
-import subprocess
+import asyncio
+import json
 import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-def run_command(cmd: List[str], description: str) -> Tuple[bool, str]:
-    """运行命令并返回结果"""
+PROJECT_ROOT = Path(__file__).parent.parent
+
+async def run_command(cmd: List[str], description: str) -> Tuple[bool, str]:
+    """运行命令并返回结果（异步执行，可与其他检查并发）"""
     print(f"🔄 执行: {description}")
     start_time = time.time()
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=PROJECT_ROOT
         )
+        stdout, stderr = await proc.communicate()
+        stdout_text = stdout.decode('utf-8', errors='replace')
+        stderr_text = stderr.decode('utf-8', errors='replace')
 
         duration = time.time() - start_time
-        success = result.returncode == 0
+        success = proc.returncode == 0
 
         if success:
             print(f"✅ {description} - 耗时: {duration:.2f}秒")
         else:
-            error_output = result.stderr.strip()
+            error_output = stderr_text.strip()
             if "No module named" in error_output:
                 print(f"⚠️  {description} - 依赖未安装，跳过")
                 print(f"   提示: 安装开发依赖 `pip install -e \"[dev]\"`")
@@ -39,76 +45,80 @@ def run_command(cmd: List[str], description: str) -> Tuple[bool, str]:
                 print(f"❌ {description} - 耗时: {duration:.2f}秒")
                 print(f"错误输出: {error_output}")
 
-        return success, result.stdout + result.stderr
+        return success, stdout_text + stderr_text
 
     except Exception as e:
         print(f"💥 {description} - 异常: {str(e)}")
         return False, str(e)
 
-def check_test_coverage() -> bool:
+async def check_test_coverage() -> bool:
     """检查测试覆盖率"""
-    success, output = run_command(
-        ["python", "-m", "pytest", "tests/", "--cov=src/spdx_scanner", "--cov-report=term-missing"],
+    coverage_file = PROJECT_ROOT / ".coverage.json"
+    success, _ = await run_command(
+        ["python", "-m", "pytest", "tests/", "--cov=src/spdx_scanner",
+         f"--cov-report=json:{coverage_file.name}", "--cov-report=term"],
         "测试覆盖率检查"
     )
 
-    if success:
-        # 解析覆盖率百分比
-        lines = output.split('\n')
-        for line in lines:
-            if 'TOTAL' in line and '%' in line:
-                parts = line.split()
-                for part in parts:
-                    if part.endswith('%'):
-                        coverage = float(part.replace('%', ''))
-                        if coverage >= 80:
-                            print(f"📊 测试覆盖率: {coverage}% ✅")
-                            return True
-                        else:
-                            print(f"📊 测试覆盖率: {coverage}% ❌ (需要≥80%)")
-                            return False
+    if not success:
+        return False
+
+    # 直接读取 JSON 报告中的总覆盖率，无需解析终端输出
+    try:
+        with open(coverage_file, encoding='utf-8') as f:
+            coverage = json.load(f)["totals"]["percent_covered"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️  无法读取覆盖率报告: {e}")
+        return False
+
+    if coverage >= 80:
+        print(f"📊 测试覆盖率: {coverage:.1f}% ✅")
+        return True
 
+    print(f"📊 测试覆盖率: {coverage:.1f}% ❌ (需要≥80%)")
     return False
 
-def run_quality_checks() -> Dict[str, bool]:
-    """运行全面的质量检查"""
-    results = {}
+async def _check_passed(cmd: List[str], description: str) -> bool:
+    """运行命令，只返回是否成功"""
+    return (await run_command(cmd, description))[0]
 
+async def run_quality_checks() -> Dict[str, bool]:
+    """运行全面的质量检查（各项检查互不依赖，并发执行）"""
     print("🔍 开始代码质量检查...")
     print("=" * 50)
 
-    # 1. 代码格式检查
-    results['black_format'] = run_command(
-        ["python", "-m", "black", "--check", "src/", "tests/", "tools/"],
-        "代码格式检查 (Black)"
-    )[0]
-
-    # 2. 导入排序检查
-    results['isort_imports'] = run_command(
-        ["python", "-m", "isort", "--check-only", "src/", "tests/", "tools/"],
-        "导入排序检查 (isort)"
-    )[0]
-
-    # 3. 代码风格检查
-    results['flake8_style'] = run_command(
-        ["python", "-m", "flake8", "src/", "tests/", "tools/"],
-        "代码风格检查 (flake8)"
-    )[0]
-
-    # 4. 类型检查
-    results['mypy_types'] = run_command(
-        ["python", "-m", "mypy", "src/"],
-        "类型检查 (mypy)"
-    )[0]
-
-    # 5. 自动化验证
-    results['automated_verification'] = run_command(
-        ["python", "tools/verification/automated_verifier.py", "--mode", "quick"],
-        "自动化验证 (快速模式)"
-    )[0]
-
-    # 6. 测试覆盖率
-    results['test_coverage'] = check_test_coverage()
+    checks = {
+        # 1. 代码格式检查
+        'black_format': _check_passed(
+            ["python", "-m", "black", "--check", "src/", "tests/", "tools/"],
+            "代码格式检查 (Black)"
+        ),
+        # 2. 导入排序检查
+        'isort_imports': _check_passed(
+            ["python", "-m", "isort", "--check-only", "src/", "tests/", "tools/"],
+            "导入排序检查 (isort)"
+        ),
+        # 3. 代码风格检查
+        'flake8_style': _check_passed(
+            ["python", "-m", "flake8", "src/", "tests/", "tools/"],
+            "代码风格检查 (flake8)"
+        ),
+        # 4. 类型检查
+        'mypy_types': _check_passed(
+            ["python", "-m", "mypy", "src/"],
+            "类型检查 (mypy)"
+        ),
+        # 5. 自动化验证
+        'automated_verification': _check_passed(
+            ["python", "tools/verification/automated_verifier.py", "--mode", "quick"],
+            "自动化验证 (快速模式)"
+        ),
+        # 6. 测试覆盖率
+        'test_coverage': check_test_coverage(),
+    }
+
+    outcomes = await asyncio.gather(*checks.values())
+    results = dict(zip(checks.keys(), outcomes))
 
     print("=" * 50)
     return results
@@ -140,7 +150,7 @@ def main():
     print("🔍 SPDX Scanner 质量管理工具")
     print("=" * 50)
 
-    results = run_quality_checks()
+    results = asyncio.run(run_quality_checks())
     generate_quality_report(results)
 
     # 返回适当的退出码
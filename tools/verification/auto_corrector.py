@@ -7,8 +7,8 @@
 
 import sys
 import os
-import re
 import ast
+import importlib.util
 import shutil
 import tempfile
 from pathlib import Path
@@ -17,17 +17,106 @@ from dataclasses import dataclass
 import json
 import subprocess
 import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根目录和src到Python路径
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
-try:
-    from spdx_scanner.corrector import SPDXCorrector
-    from spdx_scanner.config import ConfigManager
-except ImportError as e:
-    print(f"导入错误: {e}")
+# 计入圈复杂度的分支节点和函数节点
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler)
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# 复杂度和函数长度阈值
+_COMPLEXITY_THRESHOLD = 10
+_LONG_FUNCTION_LINES = 50
+
+# 建议文件中的固定建议文本
+_REFACTOR_ADVICE = (
+    "建议:\n"
+    "- 拆分为更小的函数\n"
+    "- 减少嵌套层级\n"
+    "- 使用早期返回减少分支\n"
+    "\n" + "-" * 30 + "\n\n"
+)
+_SPLIT_ADVICE = (
+    "建议:\n"
+    "1. 将长函数拆分为多个较小的函数\n"
+    "2. 每个函数应该只负责一个任务\n"
+    "3. 使用有意义的函数名\n"
+    "4. 考虑使用装饰器或生成器模式\n"
+)
+
+
+def _analyze_functions(tree: ast.AST) -> List[Tuple[str, int, int]]:
+    """单次遍历收集每个函数的 (名称, 圈复杂度, 行数)
+
+    嵌套函数单独统计，其分支不计入外层函数。
+    """
+    functions = []
+    stack = [(tree, None)]
+    while stack:
+        node, owner = stack.pop()
+        if isinstance(node, _FUNCTION_NODES):
+            # end_lineno 需要 Python 3.8+
+            end_lineno = getattr(node, 'end_lineno', None) or node.lineno
+            functions.append([node.lineno, node.name, 1, end_lineno - node.lineno + 1])
+            owner = functions[-1]
+        elif owner is not None and isinstance(node, _BRANCH_NODES):
+            owner[2] += 1
+        stack.extend((child, owner) for child in ast.iter_child_nodes(node))
+
+    functions.sort()
+    return [(name, complexity, length) for _, name, complexity, length in functions]
+
+
+# 修复类型及其对应的后续建议
+_REC_MESSAGES = {
+    'install_dependency': "检查项目的依赖管理，确保所有依赖都正确声明",
+    'format_fix': "建立代码格式化流程，在代码提交前自动格式化",
+    'config_creation': "根据项目需求自定义配置文件，设置合适的默认值",
+    'complexity_refactor': "优先重构高复杂度代码，提高代码可维护性",
+}
+
+# 传递给外部工具子进程的环境变量
+_SUBPROCESS_ENV_KEYS = ('PATH', 'HOME', 'USERPROFILE', 'SYSTEMROOT', 'TEMP', 'TMP', 'VIRTUAL_ENV')
+
+def _module_available(module: str) -> bool:
+    """在进程内检查模块是否已可导入，避免为已安装的依赖启动 pip"""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _atomic_write_text(path: Path, text: str):
+    """先写入临时文件再原子替换，避免进程中断时留下不完整的文件；不做换行符转换
+
+    临时文件名唯一，同一目标文件被并发写入时互不干扰（后完成的写入生效）。
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.')
+    try:
+        with open(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        # mkstemp 创建的文件权限为 0600，沿用目标文件原有权限
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# 问题严重级别及其显示名称（按修复顺序排列）
+_PRIORITY_LABELS = {'HIGH': '高', 'MEDIUM': '中', 'LOW': '低'}
 
 
 @dataclass
@@ -43,6 +132,31 @@ class AutoFixResult:
 class AutoCorrector:
     """自动修正器"""
 
+    # 问题类型到修复方法名的分派表
+    _HANDLERS = {
+        'import_error': '_fix_import_error',
+        'high_complexity': '_fix_high_complexity',
+        'long_function': '_fix_long_function',
+        'format_violation': '_fix_format_violation',
+        'config_error': '_fix_config_error',
+        'missing_file': '_fix_missing_file',
+        'style_violation': '_fix_style_violation',
+    }
+
+    # 问题类型所属的修正策略，策略被禁用时直接跳过该类问题
+    _ISSUE_STRATEGIES = {
+        'import_error': 'fix_imports',
+        'high_complexity': 'fix_code_quality',
+        'long_function': 'fix_code_quality',
+        'format_violation': 'fix_formatting',
+        'style_violation': 'fix_formatting',
+        'config_error': 'fix_configuration',
+        'missing_file': 'fix_configuration',
+    }
+
+    # 不能并发执行的修复：并行 pip install 会互相冲突，AST 分析为 CPU 密集型
+    _SERIAL_HANDLERS = frozenset({'_fix_import_error', '_fix_high_complexity'})
+
     def __init__(self, project_root: Path, config: Dict[str, Any]):
         self.project_root = project_root
         self.config = config
@@ -57,10 +171,32 @@ class AutoCorrector:
             'fix_imports': config.get('fix_imports', True),
             'fix_formatting': config.get('fix_formatting', True)
         }
+        self._enabled_strategies = frozenset(name for name, enabled in self.strategies.items() if enabled)
 
         # 备份设置
         self.create_backups = config.get('backup_files', True)
 
+        # 项目级工具（black、flake8）的运行结果，每次自动修复时清空
+        self._tool_cache: Dict[str, Dict[str, Any]] = {}
+
+        # 函数分析结果缓存（路径 -> [mtime, 大小, 函数列表]），跨运行持久化，文件未变化时跳过解析
+        self.function_cache_path = project_root / ".verification_function_cache"
+        self._function_cache: Dict[str, list] = {}
+        self._function_cache_dirty = False
+
+        # 并发修复设置：项目级工具串行运行，安装依赖和AST分析同一时间只允许一个
+        self.fix_concurrency = max(1, config.get('fix_concurrency', os.cpu_count() or 1))
+        self._tool_lock = threading.Lock()
+        self._serial_lock = threading.Lock()
+
+        # 依赖安装结果（模块 -> 修复结果），每次自动修复时清空
+        self._install_results: Dict[str, Dict[str, Any]] = {}
+
+        # 外部工具路径只查找一次，子进程使用精简的环境变量
+        self._tool_paths = {tool: shutil.which(tool) for tool in ('black', 'flake8')}
+        self._subprocess_env = {key: os.environ[key] for key in _SUBPROCESS_ENV_KEYS if key in os.environ}
+        self._subprocess_env['PYTHONIOENCODING'] = 'utf-8'
+
     def auto_fix_issues(self, issues: List[Dict[str, Any]]) -> AutoFixResult:
         """自动修复发现的问题"""
         print("🔧 开始自动修复问题...")
@@ -68,41 +204,48 @@ class AutoCorrector:
         fixes_applied = []
         errors = []
         backup_files = []
+        self._tool_cache.clear()
+        self._load_function_cache()
+        self._install_results.clear()
 
         # 创建备份目录
         if self.create_backups:
             self.backup_dir.mkdir(exist_ok=True)
 
         try:
-            # 按严重级别分组问题
-            high_priority = [issue for issue in issues if issue.get('severity') == 'HIGH']
-            medium_priority = [issue for issue in issues if issue.get('severity') == 'MEDIUM']
-            low_priority = [issue for issue in issues if issue.get('severity') == 'LOW']
-
-            print(f"  发现 {len(high_priority)} 个高优先级问题")
-            print(f"  发现 {len(medium_priority)} 个中优先级问题")
-            print(f"  发现 {len(low_priority)} 个低优先级问题")
-
-            # 1. 修复高优先级问题
-            if high_priority:
-                print("  修复高优先级问题...")
-                high_fixes, high_errors = self._fix_high_priority_issues(high_priority)
-                fixes_applied.extend(high_fixes)
-                errors.extend(high_errors)
-
-            # 2. 修复中优先级问题
-            if medium_priority:
-                print("  修复中优先级问题...")
-                medium_fixes, medium_errors = self._fix_medium_priority_issues(medium_priority)
-                fixes_applied.extend(medium_fixes)
-                errors.extend(medium_errors)
-
-            # 3. 修复低优先级问题
-            if low_priority:
-                print("  修复低优先级问题...")
-                low_fixes, low_errors = self._fix_low_priority_issues(low_priority)
-                fixes_applied.extend(low_fixes)
-                errors.extend(low_errors)
+            # 按严重级别分组问题（单次遍历），跳过已禁用策略的问题
+            buckets = {priority: [] for priority in _PRIORITY_LABELS}
+            get_bucket = buckets.get
+            get_strategy = self._ISSUE_STRATEGIES.get
+            enabled = self._enabled_strategies
+            skipped = 0
+            for issue in issues:
+                bucket = get_bucket(issue.get('severity'))
+                if bucket is not None:
+                    strategy = get_strategy(issue.get('type'))
+                    if strategy is not None and strategy not in enabled:
+                        skipped += 1
+                        continue
+                    bucket.append(issue)
+
+            for priority, label in _PRIORITY_LABELS.items():
+                print(f"  发现 {len(buckets[priority])} 个{label}优先级问题")
+            if skipped:
+                print(f"  跳过 {skipped} 个已禁用修正策略的问题")
+
+            # 多个缺失依赖合并为一次 pip install，只解析一次依赖
+            self._install_missing_modules([issue for bucket in buckets.values() for issue in bucket])
+
+            # 1-3. 按高、中、低优先级依次修复
+            for priority, label in _PRIORITY_LABELS.items():
+                bucket = buckets[priority]
+                if bucket:
+                    print(f"  修复{label}优先级问题...")
+                    bucket_fixes, bucket_errors = self._fix_priority_bucket(bucket, priority)
+                    fixes_applied.extend(bucket_fixes)
+                    errors.extend(bucket_errors)
+
+            self._save_function_cache()
 
             # 4. 清理备份文件（如果不需要）
             if not self.config.get('keep_backups', False):
@@ -126,127 +269,129 @@ class AutoCorrector:
             recommendations=self._generate_fix_recommendations(fixes_applied, errors)
         )
 
-    def _fix_high_priority_issues(self, issues: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]:
-        """修复高优先级问题"""
+    def _fix_priority_bucket(self, issues: List[Dict[str, Any]], priority: str) -> Tuple[List[Dict], List[Dict]]:
+        """修复同一优先级的一组问题（I/O 密集，使用线程池并发执行，结果保持原顺序）"""
         fixes = []
         errors = []
 
-        for issue in issues:
-            try:
-                fix_result = self._fix_single_issue(issue, priority='HIGH')
-                if fix_result['success']:
-                    fixes.append(fix_result['fix'])
-                else:
-                    errors.append(fix_result['error'])
-            except Exception as e:
-                errors.append({
-                    'type': 'fix_error',
-                    'issue': issue,
-                    'message': f'修复高优先级问题时异常: {str(e)}',
-                    'severity': 'HIGH'
-                })
+        with ThreadPoolExecutor(max_workers=min(self.fix_concurrency, len(issues))) as executor:
+            results = list(executor.map(lambda issue: self._safe_fix(issue, priority), issues))
 
-        return fixes, errors
-
-    def _fix_medium_priority_issues(self, issues: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]:
-        """修复中优先级问题"""
-        fixes = []
-        errors = []
-
-        for issue in issues:
-            try:
-                fix_result = self._fix_single_issue(issue, priority='MEDIUM')
-                if fix_result['success']:
-                    fixes.append(fix_result['fix'])
-                else:
-                    errors.append(fix_result['error'])
-            except Exception as e:
-                errors.append({
-                    'type': 'fix_error',
-                    'issue': issue,
-                    'message': f'修复中优先级问题时异常: {str(e)}',
-                    'severity': 'MEDIUM'
-                })
-
-        return fixes, errors
-
-    def _fix_low_priority_issues(self, issues: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]:
-        """修复低优先级问题"""
-        fixes = []
-        errors = []
-
-        for issue in issues:
-            try:
-                fix_result = self._fix_single_issue(issue, priority='LOW')
-                if fix_result['success']:
-                    fixes.append(fix_result['fix'])
-                else:
-                    errors.append(fix_result['error'])
-            except Exception as e:
-                errors.append({
-                    'type': 'fix_error',
-                    'issue': issue,
-                    'message': f'修复低优先级问题时异常: {str(e)}',
-                    'severity': 'LOW'
-                })
+        for fix_result in results:
+            if fix_result['success']:
+                fixes.append(fix_result['fix'])
+            else:
+                errors.append(fix_result['error'])
 
         return fixes, errors
 
-    def _fix_single_issue(self, issue: Dict[str, Any], priority: str) -> Dict[str, Any]:
-        """修复单个问题"""
-        issue_type = issue.get('type')
-        file_path = issue.get('file')
-        message = issue.get('message', '')
-
-        if issue_type == 'import_error':
-            return self._fix_import_error(issue)
-        elif issue_type == 'high_complexity':
-            return self._fix_high_complexity(issue)
-        elif issue_type == 'long_function':
-            return self._fix_long_function(issue)
-        elif issue_type == 'format_violation':
-            return self._fix_format_violation(issue)
-        elif issue_type == 'config_error':
-            return self._fix_config_error(issue)
-        elif issue_type == 'missing_file':
-            return self._fix_missing_file(issue)
-        elif issue_type == 'style_violation':
-            return self._fix_style_violation(issue)
-        else:
+    def _safe_fix(self, issue: Dict[str, Any], priority: str) -> Dict[str, Any]:
+        """修复单个问题，并把异常转换为错误结果"""
+        try:
+            return self._fix_single_issue(issue, priority=priority)
+        except Exception as e:
             return {
                 'success': False,
                 'error': {
-                    'type': 'unsupported_issue',
+                    'type': 'fix_error',
                     'issue': issue,
-                    'message': f'不支持的问题类型: {issue_type}',
+                    'message': f'修复{_PRIORITY_LABELS[priority]}优先级问题时异常: {str(e)}',
                     'severity': priority
                 }
             }
 
+    def _fix_single_issue(self, issue: Dict[str, Any], priority: str) -> Dict[str, Any]:
+        """修复单个问题"""
+        issue_type = issue.get('type')
+
+        handler = self._HANDLERS.get(issue_type)
+        if handler is not None:
+            if handler in self._SERIAL_HANDLERS:
+                with self._serial_lock:
+                    return getattr(self, handler)(issue)
+            return getattr(self, handler)(issue)
+
+        return {
+            'success': False,
+            'error': {
+                'type': 'unsupported_issue',
+                'issue': issue,
+                'message': f'不支持的问题类型: {issue_type}',
+                'severity': priority
+            }
+        }
+
+    def _pip_install(self, modules: List[str]) -> subprocess.CompletedProcess:
+        """以非交互模式运行 pip install"""
+        return subprocess.run([
+            sys.executable, '-m', 'pip', 'install',
+            '--no-input', '--disable-pip-version-check', '--quiet', '--no-color',
+            *modules
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=30 + 15 * (len(modules) - 1))
+
+    def _install_missing_modules(self, issues: List[Dict[str, Any]]):
+        """批量安装所有导入错误涉及的模块；批量安装失败时由 _fix_import_error 逐个重试"""
+        modules = [
+            module for module in dict.fromkeys(
+                issue.get('module') for issue in issues
+                if issue.get('type') == 'import_error' and issue.get('module')
+            )
+            if not _module_available(module)
+        ]
+        if len(modules) < 2:
+            return
+
+        try:
+            result = self._pip_install(modules)
+        except Exception as e:
+            self.logger.warning(f"批量安装依赖失败: {e}")
+            return
+
+        if result.returncode == 0:
+            for module in modules:
+                self._install_results[module] = self._install_success(module)
+
+    @staticmethod
+    def _install_success(module: str) -> Dict[str, Any]:
+        """依赖安装成功的修复结果"""
+        return {
+            'success': True,
+            'fix': {
+                'type': 'install_dependency',
+                'module': module,
+                'description': f'自动安装缺失的依赖: {module}',
+                'method': 'pip install'
+            }
+        }
+
     def _fix_import_error(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """修复导入错误"""
         module = issue.get('module')
 
         # 尝试安装缺失的模块
         if module:
+            cached = self._install_results.get(module)
+            if cached is not None:
+                return cached
+
+            if _module_available(module):
+                cached = self._install_results[module] = {
+                    'success': True,
+                    'fix': {
+                        'type': 'already_installed',
+                        'module': module,
+                        'description': f'{module} 已安装，跳过'
+                    }
+                }
+                return cached
+
             try:
-                # 简单的pip install尝试
-                result = subprocess.run([
-                    sys.executable, '-m', 'pip', 'install', module
-                ], capture_output=True, text=True, timeout=30)
+                result = self._pip_install([module])
 
                 if result.returncode == 0:
-                    return {
-                        'success': True,
-                        'fix': {
-                            'type': 'install_dependency',
-                            'module': module,
-                            'description': f'自动安装缺失的依赖: {module}',
-                            'method': 'pip install'
-                        }
-                    }
+                    cached = self._install_success(module)
                 else:
-                    return {
+                    cached = {
                         'success': False,
                         'error': {
                             'type': 'install_failed',
@@ -256,7 +401,7 @@ class AutoCorrector:
                         }
                     }
             except Exception as e:
-                return {
+                cached = {
                     'success': False,
                     'error': {
                         'type': 'install_error',
@@ -266,6 +411,9 @@ class AutoCorrector:
                     }
                 }
 
+            self._install_results[module] = cached
+            return cached
+
         return {
             'success': False,
             'error': {
@@ -277,8 +425,8 @@ class AutoCorrector:
 
     def _fix_high_complexity(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """修复高复杂度代码"""
-        file_path = issue.get('file')
-        complexity = issue.get('metric', 0)
+        get = issue.get
+        file_path, complexity = get('file'), get('metric', 0)
 
         if not file_path:
             return {
@@ -304,26 +452,23 @@ class AutoCorrector:
 
         # 尝试提取复杂函数并提供重构建议
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            tree = ast.parse(content)
-            complex_functions = self._find_complex_functions(tree)
+            functions = self._load_functions(full_path)
+            complex_functions = [
+                (name, complexity) for name, complexity, _ in functions
+                if complexity > _COMPLEXITY_THRESHOLD
+            ]
 
             if complex_functions:
                 # 创建重构建议文件
                 suggestion_file = full_path.with_suffix('.refactor_suggestions.txt')
-                with open(suggestion_file, 'w', encoding='utf-8') as f:
-                    f.write(f"代码重构建议 - {file_path}\n")
-                    f.write("=" * 50 + "\n\n")
-                    for func_name, func_complexity in complex_functions:
-                        f.write(f"函数: {func_name}\n")
-                        f.write(f"复杂度: {func_complexity}\n")
-                        f.write("建议:\n")
-                        f.write("- 拆分为更小的函数\n")
-                        f.write("- 减少嵌套层级\n")
-                        f.write("- 使用早期返回减少分支\n")
-                        f.write("\n" + "-" * 30 + "\n\n")
+                parts = [f"代码重构建议 - {file_path}\n", "=" * 50 + "\n\n"]
+                for func_name, func_complexity in complex_functions:
+                    parts.append(
+                        f"函数: {func_name}\n"
+                        f"复杂度: {func_complexity}\n"
+                        + _REFACTOR_ADVICE
+                    )
+                _atomic_write_text(suggestion_file, "".join(parts))
 
                 return {
                     'success': True,
@@ -357,54 +502,41 @@ class AutoCorrector:
                 }
             }
 
-    def _find_complex_functions(self, tree: ast.AST) -> List[Tuple[str, int]]:
-        """查找复杂函数"""
-        complex_functions = []
-
-        class ComplexityVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.current_complexity = 0
-                self.current_function = None
-
-            def visit_FunctionDef(self, node):
-                old_complexity = self.current_complexity
-                old_function = self.current_function
-
-                self.current_function = node.name
-                self.current_complexity = 1  # 基础复杂度
-
-                self.generic_visit(node)
-
-                if self.current_complexity > 10:  # 复杂度阈值
-                    complex_functions.append((node.name, self.current_complexity))
-
-                self.current_complexity = old_complexity
-                self.current_function = old_function
-
-            def visit_If(self, node):
-                self.current_complexity += 1
-                self.generic_visit(node)
-
-            def visit_While(self, node):
-                self.current_complexity += 1
-                self.generic_visit(node)
-
-            def visit_For(self, node):
-                self.current_complexity += 1
-                self.generic_visit(node)
-
-            def visit_ExceptHandler(self, node):
-                self.current_complexity += 1
-                self.generic_visit(node)
-
-        visitor = ComplexityVisitor()
-        visitor.visit(tree)
-        return complex_functions
+    def _load_function_cache(self):
+        """加载上次运行保存的函数分析结果"""
+        try:
+            self._function_cache = json.loads(self.function_cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self._function_cache = {}
+        self._function_cache_dirty = False
+
+    def _save_function_cache(self):
+        """保存本次运行新增或更新的函数分析结果"""
+        if not self._function_cache_dirty:
+            return
+        try:
+            _atomic_write_text(self.function_cache_path, json.dumps(self._function_cache))
+            self._function_cache_dirty = False
+        except OSError as e:
+            self.logger.warning(f"保存函数分析缓存失败: {e}")
+
+    def _load_functions(self, full_path: Path) -> List[Tuple[str, int, int]]:
+        """返回源文件中各函数的 (名称, 圈复杂度, 行数)，文件的 mtime 和大小未变化时直接使用缓存"""
+        stat = full_path.stat()
+        key = str(full_path)
+        cached = self._function_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        functions = _analyze_functions(ast.parse(full_path.read_bytes(), filename=key))
+        self._function_cache[key] = [stat.st_mtime_ns, stat.st_size, functions]
+        self._function_cache_dirty = True
+        return functions
 
     def _fix_long_function(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """修复长函数"""
-        file_path = issue.get('file')
-        function_length = issue.get('metric', 0)
+        get = issue.get
+        file_path, function_length = get('file'), get('metric', 0)
 
         if not file_path:
             return {'success': False, 'error': {'type': 'missing_file_path', 'message': '缺少文件路径', 'severity': 'MEDIUM'}}
@@ -416,18 +548,22 @@ class AutoCorrector:
         # 创建函数拆分建议
         suggestion_file = full_path.with_suffix('.function_split_suggestions.txt')
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            with open(suggestion_file, 'w', encoding='utf-8') as f:
-                f.write(f"函数拆分建议 - {file_path}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"检测到长度超过50行的函数 (当前: {function_length} 行)\n\n")
-                f.write("建议:\n")
-                f.write("1. 将长函数拆分为多个较小的函数\n")
-                f.write("2. 每个函数应该只负责一个任务\n")
-                f.write("3. 使用有意义的函数名\n")
-                f.write("4. 考虑使用装饰器或生成器模式\n")
+            functions = self._load_functions(full_path)
+            long_functions = [
+                (name, length) for name, _, length in functions
+                if length > _LONG_FUNCTION_LINES
+            ]
+
+            parts = [
+                f"函数拆分建议 - {file_path}\n",
+                "=" * 50 + "\n\n",
+                f"检测到长度超过{_LONG_FUNCTION_LINES}行的函数 (当前: {function_length} 行)\n\n",
+            ]
+            parts.extend(f"函数: {func_name} ({func_length} 行)\n" for func_name, func_length in long_functions)
+            if long_functions:
+                parts.append("\n")
+            parts.append(_SPLIT_ADVICE)
+            _atomic_write_text(suggestion_file, "".join(parts))
 
             return {
                 'success': True,
@@ -452,49 +588,50 @@ class AutoCorrector:
             }
 
     def _fix_format_violation(self, issue: Dict[str, Any]) -> Dict[str, Any]:
-        """修复格式违规"""
+        """修复格式违规（black 作用于整个项目，每次自动修复只运行一次）"""
+        with self._tool_lock:
+            if 'black' not in self._tool_cache:
+                self._tool_cache['black'] = self._run_black()
+            return self._tool_cache['black']
+
+    def _run_black(self) -> Dict[str, Any]:
+        """运行black格式化工具"""
         # 尝试运行black格式化工具
         try:
-            result = subprocess.run([
-                'black', '--check', '--diff', 'src/', 'tests/'
-            ], cwd=self.project_root, capture_output=True, text=True, timeout=30)
+            # black 是幂等的，直接格式化并根据输出判断是否有文件被修改
+            result = self._run_tool('black', 'src/', 'tests/', timeout=60)
 
             if result.returncode != 0:
-                # 尝试自动格式化
-                format_result = subprocess.run([
-                    'black', 'src/', 'tests/'
-                ], cwd=self.project_root, capture_output=True, text=True, timeout=60)
-
-                if format_result.returncode == 0:
-                    return {
-                        'success': True,
-                        'fix': {
-                            'type': 'format_fix',
-                            'tool': 'black',
-                            'description': '使用black自动格式化代码',
-                            'changes': format_result.stdout
-                        }
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': {
-                            'type': 'format_fix_failed',
-                            'tool': 'black',
-                            'message': f'自动格式化失败: {format_result.stderr}',
-                            'severity': 'LOW'
-                        }
+                return {
+                    'success': False,
+                    'error': {
+                        'type': 'format_fix_failed',
+                        'tool': 'black',
+                        'message': f'自动格式化失败: {result.stderr}',
+                        'severity': 'LOW'
                     }
-            else:
+                }
+
+            if 'reformatted' in result.stderr:
                 return {
                     'success': True,
                     'fix': {
-                        'type': 'format_check',
+                        'type': 'format_fix',
                         'tool': 'black',
-                        'description': '代码格式检查通过'
+                        'description': '使用black自动格式化代码',
+                        'changes': result.stderr
                     }
                 }
 
+            return {
+                'success': True,
+                'fix': {
+                    'type': 'format_check',
+                    'tool': 'black',
+                    'description': '代码格式检查通过'
+                }
+            }
+
         except subprocess.TimeoutExpired:
             return {
                 'success': False,
@@ -529,6 +666,8 @@ class AutoCorrector:
     def _fix_config_error(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """修复配置错误"""
         try:
+            # 仅在修复配置时才导入 spdx_scanner，避免加载本模块时的额外开销
+            from spdx_scanner.config import ConfigManager
             config_manager = ConfigManager(str(self.project_root))
 
             # 检查并创建默认配置文件
@@ -554,8 +693,7 @@ class AutoCorrector:
                     }
                 }
 
-                with open(config_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_config, f, indent=2)
+                _atomic_write_text(config_file, json.dumps(default_config, indent=2))
 
                 return {
                     'success': True,
@@ -605,7 +743,7 @@ if __name__ == "__main__":
 
             try:
                 cli_file.parent.mkdir(parents=True, exist_ok=True)
-                cli_file.write_text(cli_content)
+                _atomic_write_text(cli_file, cli_content)
 
                 return {
                     'success': True,
@@ -637,13 +775,30 @@ if __name__ == "__main__":
             }
         }
 
+    def _run_tool(self, tool: str, *args: str, timeout: int) -> subprocess.CompletedProcess:
+        """以缓存的绝对路径运行外部工具，只捕获 stderr；工具未安装时不启动子进程，直接抛出 FileNotFoundError"""
+        tool_path = self._tool_paths.get(tool)
+        if tool_path is None:
+            raise FileNotFoundError(tool)
+
+        return subprocess.run(
+            [tool_path, *args], cwd=self.project_root, env=self._subprocess_env,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, timeout=timeout
+        )
+
     def _fix_style_violation(self, issue: Dict[str, Any]) -> Dict[str, Any]:
-        """修复样式违规"""
+        """修复样式违规（flake8 作用于整个项目，每次自动修复只运行一次）"""
+        with self._tool_lock:
+            if 'flake8' not in self._tool_cache:
+                self._tool_cache['flake8'] = self._run_flake8()
+            return self._tool_cache['flake8']
+
+    def _run_flake8(self) -> Dict[str, Any]:
+        """运行flake8样式修复"""
         # 尝试使用flake8自动修复某些问题
         try:
-            result = subprocess.run([
-                'flake8', 'src/', 'tests/', '--fix', '--ignore=E501'
-            ], cwd=self.project_root, capture_output=True, text=True, timeout=30)
+            result = self._run_tool('flake8', 'src/', 'tests/', '--fix', '--ignore=E501', timeout=30)
 
             if result.returncode == 0:
                 return {
@@ -707,25 +862,9 @@ if __name__ == "__main__":
 
     def _generate_fix_recommendations(self, fixes: List[Dict], errors: List[Dict]) -> List[str]:
         """生成修复建议"""
-        recommendations = []
-
         # 基于修复的类型生成建议
-        fix_types = {}
-        for fix in fixes:
-            fix_type = fix.get('type')
-            fix_types[fix_type] = fix_types.get(fix_type, 0) + 1
-
-        if 'install_dependency' in fix_types:
-            recommendations.append("检查项目的依赖管理，确保所有依赖都正确声明")
-
-        if 'format_fix' in fix_types:
-            recommendations.append("建立代码格式化流程，在代码提交前自动格式化")
-
-        if 'config_creation' in fix_types:
-            recommendations.append("根据项目需求自定义配置文件，设置合适的默认值")
-
-        if 'complexity_refactor' in fix_types:
-            recommendations.append("优先重构高复杂度代码，提高代码可维护性")
+        fix_types = Counter(fix.get('type') for fix in fixes)
+        recommendations = [message for fix_type, message in _REC_MESSAGES.items() if fix_types[fix_type]]
 
         if errors:
             recommendations.append("检查自动修复失败的错误，手动解决遗留问题")
@@ -12,38 +12,180 @@ SPDX Scanner 自动化验证工具
 import os
 import sys
 import json
+import importlib.util
+from importlib.machinery import PathFinder
 import argparse
 import time
+import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Union
+from dataclasses import dataclass, asdict, fields, is_dataclass
 import logging
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    # 未安装 orjson 时使用标准库 json
+    orjson = None
 
 # 添加项目根目录和src到Python路径
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
-try:
-    from spdx_scanner.scanner import FileScanner, create_default_scanner
-    from spdx_scanner.parser import SPDXParser
-    from spdx_scanner.validator import SPDXValidator
-    from spdx_scanner.corrector import SPDXCorrector
-    from spdx_scanner.reporter import ReportGenerator
-    from spdx_scanner.models import ScanResult, SPDXInfo, ValidationResult
-except ImportError as e:
-    print(f"导入错误: {e}")
+# 只检查 spdx_scanner 是否可用，各验证模块在首次使用时才导入
+if importlib.util.find_spec('spdx_scanner') is None:
+    print("导入错误: No module named 'spdx_scanner'")
     print("请确保您在项目根目录中运行此脚本")
     sys.exit(1)
 
 # 添加工具目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent))
 
-from spdx_validator import SPDXComponentValidator
-from quality_checker import CodeQualityChecker
-from integration_tester import IntegrationTester
-from auto_corrector import AutoCorrector
+
+# 问题类型及其对应的改进建议
+_ISSUE_RECOMMENDATIONS = {
+    'import_error': "检查项目依赖，确保所有必需的模块都已正确安装",
+    'code_quality': "运行代码质量分析，修复发现的问题以提高代码可维护性",
+    'test_failure': "运行测试套件，修复失败的测试用例以确保功能正确性",
+    'missing_file': "检查项目结构，确保所有必需的文件都存在",
+}
+
+# 无论发现什么问题都会给出的通用建议
+_GENERAL_RECOMMENDATIONS = (
+    "定期运行自动化验证以确保代码质量",
+    "建立持续集成流程，在代码提交前自动验证",
+    "保持测试覆盖率在80%以上",
+    "及时修复发现的问题，避免技术债务累积",
+)
+
+# 验证状态的显示文本
+_STATUS_MAP = {
+    'PASS': '✅ 通过',
+    'FAIL': '❌ 失败',
+    'WARNING': '⚠️  警告',
+    'UNKNOWN': '❓ 未知'
+}
+
+# 报告中问题和修复的显示字段及缺省值
+_ISSUE_DEFAULTS = {'severity': 'UNKNOWN', 'type': 'unknown', 'message': '无详细信息'}
+_ISSUE_FIELDS = itemgetter('severity', 'type', 'message')
+_FIX_DEFAULTS = {'type': 'unknown', 'description': '无描述'}
+_FIX_FIELDS = itemgetter('type', 'description')
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON 序列化回调：直接展开数据类字段，避免 asdict 的递归深拷贝"""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(obj: Any, pretty: bool) -> bytes:
+    """序列化为 UTF-8 编码的 JSON，优先使用 orjson"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+    if pretty:
+        return json.dumps(obj, default=_json_default, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, default=_json_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_report(output_file: str, content: Union[str, bytes]):
+    """以大缓冲区的二进制模式写入报告"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(content)
+
+
+# HTML报告的固定片段，避免每次生成报告时重新构建
+_HTML_REPORT_HEAD = """
+<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SPDX Scanner 验证报告</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+        .header { text-align: center; border-bottom: 3px solid #007acc; padding-bottom: 20px; }
+        .status { display: inline-block; padding: 5px 15px; border-radius: 20px; color: white; font-weight: bold; }
+        .status-pass { background-color: #28a745; }
+        .status-fail { background-color: #dc3545; }
+        .status-warning { background-color: #ffc107; color: #333; }
+        .section { margin: 30px 0; padding: 20px; border: 1px solid #ddd; border-radius: 5px; }
+        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }
+        .metric { background: #f8f9fa; padding: 15px; border-radius: 5px; text-align: center; }
+        .metric-value { font-size: 2em; font-weight: bold; color: #007acc; }
+        .issue { background: #fff3cd; border: 1px solid #ffeaa7; padding: 10px; margin: 5px 0; border-radius: 3px; }
+        .fix { background: #d4edda; border: 1px solid #c3e6cb; padding: 10px; margin: 5px 0; border-radius: 3px; }
+    </style>
+</head>
+<body>
+"""
+
+_HTML_REPORT_SUMMARY = """    <div class="header">
+        <h1>🔍 SPDX Scanner 验证报告</h1>
+        <p>生成时间: {timestamp}</p>
+        <p>验证模式: {mode}</p>
+        <p>整体状态: <span class="status status-{status_class}">{status}</span></p>
+    </div>
+
+    <div class="section">
+        <h2>📊 验证摘要</h2>
+        <div class="metrics">
+            <div class="metric">
+                <div class="metric-value">{issue_count}</div>
+                <div>发现问题</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">{fix_count}</div>
+                <div>自动修复</div>
+            </div>
+            <div class="metric">
+                <div class="metric-value">{component_count}</div>
+                <div>验证组件</div>
+            </div>
+        </div>
+    </div>
+"""
+
+_HTML_ISSUES_HEAD = """
+    <div class="section">
+        <h2>⚠️ 发现的问题</h2>
+"""
+
+_HTML_ISSUE_ROW = """
+        <div class="issue">
+            <strong>{index}. [{severity}] {type}</strong><br>
+            {message}
+        </div>
+"""
+
+_HTML_FIXES_HEAD = """
+    <div class="section">
+        <h2>🔧 自动修复</h2>
+"""
+
+_HTML_FIX_ROW = """
+        <div class="fix">
+            <strong>{index}. {type}</strong><br>
+            {description}
+        </div>
+"""
+
+_HTML_SECTION_TAIL = "    </div>\n"
+
+_HTML_REPORT_TAIL = """
+</body>
+</html>
+"""
 
 
 @dataclass
@@ -59,6 +201,82 @@ class VerificationResult:
     recommendations: List[str]
 
 
+# 计算源码指纹时跳过的目录，以及参与指纹计算的项目根目录配置文件
+_FINGERPRINT_SKIP_DIRS = frozenset({'__pycache__', 'venv', '.venv', 'node_modules'})
+_FINGERPRINT_ROOT_FILES = ('pyproject.toml', 'spdx-scanner.config.json')
+
+
+def _walk_source_files(directory: str) -> Iterator[os.DirEntry]:
+    """基于 os.scandir 的深度优先遍历，产出所有 Python 源文件条目"""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if name in _FINGERPRINT_SKIP_DIRS or name.startswith('.'):
+                continue
+            yield from _walk_source_files(entry.path)
+        elif name.endswith('.py'):
+            yield entry
+
+
+class VerificationCache:
+    """验证结果的磁盘缓存
+
+    以项目源码的 (路径, 大小, mtime) 和生效的验证配置计算指纹，源码或配置变化后缓存自动失效。
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.cache_dir = project_root / ".spdx_verify_cache"
+
+    def fingerprint(self, config: Dict[str, Any]) -> str:
+        """计算项目源码与验证配置的指纹"""
+        root = str(self.project_root)
+        records = []
+        for entry in _walk_source_files(root):
+            stat = entry.stat()
+            records.append((os.path.relpath(entry.path, root), stat.st_size, stat.st_mtime_ns))
+        for name in _FINGERPRINT_ROOT_FILES:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            records.append((name, stat.st_size, stat.st_mtime_ns))
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+        for record in sorted(records):
+            digest.update(repr(record).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, mode: str, fingerprint: str) -> Path:
+        return self.cache_dir / f"{mode}_{fingerprint}.json"
+
+    def load(self, mode: str, fingerprint: str) -> Optional[VerificationResult]:
+        """读取与指纹匹配的验证结果，不存在或已损坏时返回 None"""
+        try:
+            data = json.loads(self._path(mode, fingerprint).read_bytes())
+            return VerificationResult(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, mode: str, fingerprint: str, result: VerificationResult):
+        """保存验证结果，并删除同一模式下已过期的缓存"""
+        path = self._path(mode, fingerprint)
+        self.cache_dir.mkdir(exist_ok=True)
+        for stale in self.cache_dir.glob(f"{mode}_*.json"):
+            if stale != path:
+                stale.unlink()
+
+        tmp_path = path.with_name(path.name + '.tmp')
+        _write_report(str(tmp_path), _dumps_json(result, pretty=False))
+        os.replace(tmp_path, path)
+
+
 class AutomatedVerifier:
     """自动化验证器主类"""
 
@@ -70,12 +288,45 @@ class AutomatedVerifier:
         # 验证结果存储
         self.verification_result = None
 
-        # 初始化各验证模块
-        self.spdx_validator = SPDXComponentValidator(project_root, self.config.get('spdx', {}))
-        self.quality_checker = CodeQualityChecker(project_root, self.config.get('quality', {}))
-        self.integration_tester = IntegrationTester(project_root, self.config.get('integration', {}))
-        self.auto_corrector = AutoCorrector(project_root, self.config.get('auto_fix', {}))
+        # 各验证模块在首次访问时才导入并初始化
+        self._spdx_validator = None
+        self._quality_checker = None
+        self._integration_tester = None
+        self._auto_corrector = None
         self.report_generator = SimpleReportGenerator(self.config.get('report', {}))
+        self.cache = VerificationCache(project_root)
+
+    @property
+    def spdx_validator(self):
+        """SPDX组件验证器（首次访问时创建）"""
+        if self._spdx_validator is None:
+            from spdx_validator import SPDXComponentValidator
+            self._spdx_validator = SPDXComponentValidator(self.project_root, self.config.get('spdx', {}))
+        return self._spdx_validator
+
+    @property
+    def quality_checker(self):
+        """代码质量检查器（首次访问时创建）"""
+        if self._quality_checker is None:
+            from quality_checker import CodeQualityChecker
+            self._quality_checker = CodeQualityChecker(self.project_root, self.config.get('quality', {}))
+        return self._quality_checker
+
+    @property
+    def integration_tester(self):
+        """集成测试器（首次访问时创建）"""
+        if self._integration_tester is None:
+            from integration_tester import IntegrationTester
+            self._integration_tester = IntegrationTester(self.project_root, self.config.get('integration', {}))
+        return self._integration_tester
+
+    @property
+    def auto_corrector(self):
+        """自动修正器（首次访问时创建）"""
+        if self._auto_corrector is None:
+            from auto_corrector import AutoCorrector
+            self._auto_corrector = AutoCorrector(self.project_root, self.config.get('auto_fix', {}))
+        return self._auto_corrector
 
     def _load_default_config(self) -> Dict[str, Any]:
         """加载默认配置"""
@@ -103,7 +354,8 @@ class AutomatedVerifier:
                 'test_cli': True,
                 'test_config': True,
                 'test_git_integration': True,
-                'test_report_formats': True
+                'test_report_formats': True,
+                'tmp_dir': None
             },
             'auto_fix': {
                 'enable_auto_fix': True,
@@ -115,6 +367,12 @@ class AutomatedVerifier:
                 'format': 'console',
                 'include_details': True,
                 'include_recommendations': True
+            },
+            'quick': {
+                'verify_executes': False
+            },
+            'cache': {
+                'enabled': False
             }
         }
 
@@ -126,38 +384,58 @@ class AutomatedVerifier:
         )
         return logging.getLogger(__name__)
 
-    def verify_all(self, mode: str = 'standard') -> VerificationResult:
-        """执行完整验证"""
-        start_time = time.time()
-        self.logger.info(f"开始执行 {mode} 模式验证...")
+    def verify_all(self, mode: str = 'standard', force: bool = False) -> VerificationResult:
+        """执行完整验证
+
+        启用缓存（cache.enabled，默认关闭）且源码和配置均未变化时，直接返回上次同一模式的
+        非失败验证结果；force 为真时忽略缓存。缓存不感知环境变化和非Python文件的修改。
+        """
+        # 时间戳取验证开始时刻；耗时使用单调时钟，不受系统时间调整影响
+        timestamp = datetime.now().isoformat(timespec='seconds')
+        start_time = time.monotonic()
+
+        use_cache = self.config.get('cache', {}).get('enabled', False)
+        fingerprint = None
+        if use_cache:
+            fingerprint = self.cache.fingerprint(self.config)
+            if not force:
+                cached = self.cache.load(mode, fingerprint)
+                if cached is not None:
+                    self.logger.info("源码和配置未变化，使用缓存的 %s 模式验证结果", mode)
+                    print(f"♻️  使用缓存的验证结果（验证于 {cached.timestamp}），如需重新验证请使用 --force")
+                    self.verification_result = cached
+                    return cached
+
+        self.logger.info("开始执行 %s 模式验证...", mode)
 
         components_results = {}
         issues_found = []
         auto_fixes = []
         verification_result = 'PASS'  # 默认状态
-        duration = 0.0  # 初始化duration
 
         try:
-            # 1. SPDX组件验证
-            if mode in ['standard', 'full', 'ci']:
-                self.logger.info("执行SPDX组件验证...")
-                spdx_result = self.spdx_validator.verify_all()
-                components_results['spdx'] = asdict(spdx_result)
-                issues_found.extend(spdx_result.issues)
-
-            # 2. 代码质量验证
-            if mode in ['standard', 'full']:
-                self.logger.info("执行代码质量验证...")
-                quality_result = self.quality_checker.analyze()
-                components_results['quality'] = asdict(quality_result)
-                issues_found.extend(quality_result.issues)
-
-            # 3. 集成测试验证
-            if mode in ['full', 'ci']:
-                self.logger.info("执行集成测试验证...")
-                integration_result = self.integration_tester.run_all_tests()
-                components_results['integration'] = asdict(integration_result)
-                issues_found.extend(integration_result.issues)
+            # 1-3. SPDX组件验证、代码质量验证、集成测试验证
+            # 各组件互不共享可变状态且以子进程和文件I/O为主，并发执行，按固定顺序汇总结果
+            steps = [
+                (name, label, run)
+                for name, label, run, modes in (
+                    ('spdx', "SPDX组件验证", lambda: self.spdx_validator.verify_all(), ('standard', 'full', 'ci')),
+                    ('quality', "代码质量验证", lambda: self.quality_checker.analyze(), ('standard', 'full')),
+                    ('integration', "集成测试验证", lambda: self.integration_tester.run_all_tests(), ('full', 'ci')),
+                )
+                if mode in modes
+            ]
+            if steps:
+                with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                    futures = []
+                    for name, label, run in steps:
+                        self.logger.info("执行%s...", label)
+                        futures.append((name, executor.submit(run)))
+
+                    for name, future in futures:
+                        component_result = future.result()
+                        components_results[name] = asdict(component_result)
+                        issues_found.extend(component_result.issues)
 
             # 4. 快速验证模式
             if mode == 'quick':
@@ -179,36 +457,20 @@ class AutomatedVerifier:
             else:
                 verification_result = self._determine_overall_status(components_results, [])
 
-            # 构建最终结果
-            result = VerificationResult(
-                timestamp=datetime.now().isoformat(),
-                mode=mode,
-                duration=duration,
-                overall_status=verification_result,
-                components=components_results,
-                issues_found=issues_found,
-                auto_fixes_applied=auto_fixes,
-                recommendations=self._generate_recommendations(issues_found)
-            )
-
-            self.verification_result = result
-            return result
-
         except Exception as e:
-            self.logger.error(f"验证过程中发生错误: {e}")
+            self.logger.error("验证过程中发生错误: %s", e)
             components_results['error'] = {
                 'status': 'FAILED',
                 'error': str(e)
             }
             verification_result = 'FAIL'
-            duration = time.time() - start_time  # 在except块中也计算duration
 
         # 在所有情况下都要计算duration
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
 
         # 构建最终结果
         result = VerificationResult(
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
             mode=mode,
             duration=duration,
             overall_status=verification_result,
@@ -219,6 +481,14 @@ class AutomatedVerifier:
         )
 
         self.verification_result = result
+
+        # 验证失败或过程异常时不缓存结果，修复环境或数据后下次运行会重新验证
+        if fingerprint is not None and result.overall_status != 'FAIL' and 'error' not in components_results:
+            try:
+                self.cache.save(mode, fingerprint, result)
+            except OSError as e:
+                self.logger.warning("保存验证结果缓存失败: %s", e)
+
         return result
 
     def _quick_verify(self) -> Dict[str, Any]:
@@ -231,13 +501,25 @@ class AutomatedVerifier:
 
         try:
             # 检查核心模块是否可以导入
+            # 默认只在包目录中定位模块文件，不导入 spdx_scanner（其 __init__ 会加载全部核心模块）；
+            # verify_executes 为真时才实际导入
             core_modules = ['scanner', 'parser', 'validator', 'corrector']
+            verify_executes = self.config.get('quick', {}).get('verify_executes', False)
+            package_spec = None if verify_executes else importlib.util.find_spec('spdx_scanner')
+            search_locations = package_spec.submodule_search_locations if package_spec else None
             for module in core_modules:
+                module_name = f'spdx_scanner.{module}'
                 try:
-                    __import__(f'spdx_scanner.{module}')
-                    quick_result['checks'].append(f'✓ {module} 导入成功')
+                    if verify_executes:
+                        __import__(module_name)
+                        quick_result['checks'].append(f'✓ {module} 导入成功')
+                    else:
+                        if not search_locations or PathFinder.find_spec(module_name, search_locations) is None:
+                            raise ImportError(f"No module named '{module_name}'")
+                        quick_result['checks'].append(f'✓ {module} 模块存在')
                 except ImportError as e:
-                    quick_result['checks'].append(f'✗ {module} 导入失败: {e}')
+                    failure = '导入失败' if verify_executes else '未找到'
+                    quick_result['checks'].append(f'✗ {module} {failure}: {e}')
                     quick_result['issues'].append({
                         'type': 'import_error',
                         'module': module,
@@ -277,54 +559,27 @@ class AutomatedVerifier:
         if 'error' in components_results:
             return 'FAIL'
 
-        # 检查是否有失败的关键组件
-        critical_failures = 0
+        # 检查是否有失败的关键组件（各组件结果均以字典存储），遇到第一个失败即返回
         warnings = 0
+        for result in components_results.values():
+            status = result.get('status', 'UNKNOWN')
+            if status == 'FAIL':
+                return 'FAIL'
+            if status == 'WARNING':
+                warnings += 1
 
-        for component, result in components_results.items():
-            if isinstance(result, dict):
-                status = result.get('status', 'UNKNOWN')
-                if status == 'FAIL':
-                    critical_failures += 1
-                elif status == 'WARNING':
-                    warnings += 1
-
-        if critical_failures > 0:
-            return 'FAIL'
-        elif warnings > 2:
-            return 'WARNING'
-        else:
-            return 'PASS'
+        return 'WARNING' if warnings > 2 else 'PASS'
 
     def _generate_recommendations(self, issues: List[Dict]) -> List[str]:
         """生成改进建议"""
-        recommendations = []
-
         # 基于问题类型生成建议
-        issue_types = {}
-        for issue in issues:
-            issue_type = issue.get('type', 'unknown')
-            issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-
-        if 'import_error' in issue_types:
-            recommendations.append("检查项目依赖，确保所有必需的模块都已正确安装")
-
-        if 'code_quality' in issue_types:
-            recommendations.append("运行代码质量分析，修复发现的问题以提高代码可维护性")
-
-        if 'test_failure' in issue_types:
-            recommendations.append("运行测试套件，修复失败的测试用例以确保功能正确性")
-
-        if 'missing_file' in issue_types:
-            recommendations.append("检查项目结构，确保所有必需的文件都存在")
+        issue_types = Counter(issue.get('type', 'unknown') for issue in issues)
+        recommendations = [
+            message for issue_type, message in _ISSUE_RECOMMENDATIONS.items() if issue_types[issue_type]
+        ]
 
         # 通用建议
-        recommendations.extend([
-            "定期运行自动化验证以确保代码质量",
-            "建立持续集成流程，在代码提交前自动验证",
-            "保持测试覆盖率在80%以上",
-            "及时修复发现的问题，避免技术债务累积"
-        ])
+        recommendations.extend(_GENERAL_RECOMMENDATIONS)
 
         return recommendations
 
@@ -346,6 +601,14 @@ class SimpleReportGenerator:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
 
+        # 报告中最多显示的问题和修复数量
+        self.max_issues_shown = config.get('max_issues_shown', 10)
+        self.max_fixes_shown = config.get('max_fixes_shown', 5)
+
+        # 是否输出问题/修复详情和改进建议；关闭时直接跳过对应章节的构建
+        self.include_details = config.get('include_details', True)
+        self.include_recommendations = config.get('include_recommendations', True)
+
     def generate(self, result: VerificationResult, output_format: str = 'console', output_file: Optional[str] = None) -> str:
         """生成验证报告"""
         if output_format == 'console':
@@ -381,28 +644,23 @@ class SimpleReportGenerator:
         lines.append(f"验证组件数量: {len(result.components)}")
 
         # 问题详情
-        if result.issues_found:
+        if self.include_details and result.issues_found:
             lines.append("")
             lines.append("⚠️  发现的问题")
             lines.append("-" * 40)
-            for i, issue in enumerate(result.issues_found[:10], 1):  # 最多显示10个问题
-                severity = issue.get('severity', 'UNKNOWN')
-                issue_type = issue.get('type', 'unknown')
-                message = issue.get('message', '无详细信息')
+            for i, severity, issue_type, message in self._issue_rows(result):
                 lines.append(f"{i}. [{severity}] {issue_type}: {message}")
 
         # 自动修复详情
-        if result.auto_fixes_applied:
+        if self.include_details and result.auto_fixes_applied:
             lines.append("")
             lines.append("🔧 自动修复")
             lines.append("-" * 40)
-            for i, fix in enumerate(result.auto_fixes_applied[:5], 1):  # 最多显示5个修复
-                fix_type = fix.get('type', 'unknown')
-                description = fix.get('description', '无描述')
+            for i, fix_type, description in self._fix_rows(result):
                 lines.append(f"{i}. {fix_type}: {description}")
 
         # 改进建议
-        if result.recommendations:
+        if self.include_recommendations and result.recommendations:
             lines.append("")
             lines.append("💡 改进建议")
             lines.append("-" * 40)
@@ -416,30 +674,34 @@ class SimpleReportGenerator:
 
         # 输出到文件或控制台
         if output_file:
-            Path(output_file).write_text(report_content, encoding='utf-8')
+            _write_report(output_file, report_content)
             print(f"报告已保存到: {output_file}")
         else:
             print(report_content)
 
         return report_content
 
+    def _issue_rows(self, result: VerificationResult) -> Iterator[Tuple[int, Any, Any, Any]]:
+        """依次产出报告中显示的问题 (序号, 严重级别, 类型, 信息)，缺失字段使用默认值"""
+        for i, issue in enumerate(islice(result.issues_found, self.max_issues_shown), 1):
+            yield (i, *_ISSUE_FIELDS({**_ISSUE_DEFAULTS, **issue}))
+
+    def _fix_rows(self, result: VerificationResult) -> Iterator[Tuple[int, Any, Any]]:
+        """依次产出报告中显示的修复 (序号, 类型, 描述)，缺失字段使用默认值"""
+        for i, fix in enumerate(islice(result.auto_fixes_applied, self.max_fixes_shown), 1):
+            yield (i, *_FIX_FIELDS({**_FIX_DEFAULTS, **fix}))
+
     def _format_status(self, status: str) -> str:
         """格式化状态显示"""
-        status_map = {
-            'PASS': '✅ 通过',
-            'FAIL': '❌ 失败',
-            'WARNING': '⚠️  警告',
-            'UNKNOWN': '❓ 未知'
-        }
-        return status_map.get(status, status)
+        return _STATUS_MAP.get(status, status)
 
     def _generate_json_report(self, result: VerificationResult, output_file: Optional[str] = None) -> str:
         """生成JSON报告"""
-        report_data = asdict(result)
-        report_json = json.dumps(report_data, indent=2, ensure_ascii=False)
-
+        # 各组件结果在 verify_all 中已转换为字典，序列化时只需展开顶层数据类
+        report_bytes = _dumps_json(result, pretty=True)
+        report_json = report_bytes.decode('utf-8')
         if output_file:
-            Path(output_file).write_text(report_json, encoding='utf-8')
+            _write_report(output_file, report_bytes)
             print(f"JSON报告已保存到: {output_file}")
         else:
             print(report_json)
@@ -448,97 +710,36 @@ class SimpleReportGenerator:
 
     def _generate_html_report(self, result: VerificationResult, output_file: Optional[str] = None) -> str:
         """生成HTML报告"""
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SPDX Scanner 验证报告</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-        .header {{ text-align: center; border-bottom: 3px solid #007acc; padding-bottom: 20px; }}
-        .status {{ display: inline-block; padding: 5px 15px; border-radius: 20px; color: white; font-weight: bold; }}
-        .status-pass {{ background-color: #28a745; }}
-        .status-fail {{ background-color: #dc3545; }}
-        .status-warning {{ background-color: #ffc107; color: #333; }}
-        .section {{ margin: 30px 0; padding: 20px; border: 1px solid #ddd; border-radius: 5px; }}
-        .metrics {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }}
-        .metric {{ background: #f8f9fa; padding: 15px; border-radius: 5px; text-align: center; }}
-        .metric-value {{ font-size: 2em; font-weight: bold; color: #007acc; }}
-        .issue {{ background: #fff3cd; border: 1px solid #ffeaa7; padding: 10px; margin: 5px 0; border-radius: 3px; }}
-        .fix {{ background: #d4edda; border: 1px solid #c3e6cb; padding: 10px; margin: 5px 0; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🔍 SPDX Scanner 验证报告</h1>
-        <p>生成时间: {result.timestamp}</p>
-        <p>验证模式: {result.mode}</p>
-        <p>整体状态: <span class="status status-{result.overall_status.lower()}">{self._format_status(result.overall_status)}</span></p>
-    </div>
-
-    <div class="section">
-        <h2>📊 验证摘要</h2>
-        <div class="metrics">
-            <div class="metric">
-                <div class="metric-value">{len(result.issues_found)}</div>
-                <div>发现问题</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{len(result.auto_fixes_applied)}</div>
-                <div>自动修复</div>
-            </div>
-            <div class="metric">
-                <div class="metric-value">{len(result.components)}</div>
-                <div>验证组件</div>
-            </div>
-        </div>
-    </div>
-"""
+        parts = [_HTML_REPORT_HEAD, _HTML_REPORT_SUMMARY.format(
+            timestamp=result.timestamp,
+            mode=result.mode,
+            status_class=result.overall_status.lower(),
+            status=self._format_status(result.overall_status),
+            issue_count=len(result.issues_found),
+            fix_count=len(result.auto_fixes_applied),
+            component_count=len(result.components),
+        )]
+        append = parts.append
 
         # 添加问题详情
-        if result.issues_found:
-            html_content += """
-    <div class="section">
-        <h2>⚠️ 发现的问题</h2>
-"""
-            for i, issue in enumerate(result.issues_found[:10], 1):
-                severity = issue.get('severity', 'UNKNOWN').lower()
-                issue_type = issue.get('type', 'unknown')
-                message = issue.get('message', '无详细信息')
-                html_content += f"""
-        <div class="issue">
-            <strong>{i}. [{issue.get('severity', 'UNKNOWN')}] {issue_type}</strong><br>
-            {message}
-        </div>
-"""
-            html_content += "    </div>\n"
+        if self.include_details and result.issues_found:
+            append(_HTML_ISSUES_HEAD)
+            for i, severity, issue_type, message in self._issue_rows(result):
+                append(_HTML_ISSUE_ROW.format(index=i, severity=severity, type=issue_type, message=message))
+            append(_HTML_SECTION_TAIL)
 
         # 添加修复详情
-        if result.auto_fixes_applied:
-            html_content += """
-    <div class="section">
-        <h2>🔧 自动修复</h2>
-"""
-            for i, fix in enumerate(result.auto_fixes_applied[:5], 1):
-                fix_type = fix.get('type', 'unknown')
-                description = fix.get('description', '无描述')
-                html_content += f"""
-        <div class="fix">
-            <strong>{i}. {fix_type}</strong><br>
-            {description}
-        </div>
-"""
-            html_content += "    </div>\n"
+        if self.include_details and result.auto_fixes_applied:
+            append(_HTML_FIXES_HEAD)
+            for i, fix_type, description in self._fix_rows(result):
+                append(_HTML_FIX_ROW.format(index=i, type=fix_type, description=description))
+            append(_HTML_SECTION_TAIL)
 
-        html_content += """
-</body>
-</html>
-"""
+        append(_HTML_REPORT_TAIL)
+        html_content = "".join(parts)
 
         if output_file:
-            Path(output_file).write_text(html_content, encoding='utf-8')
+            _write_report(output_file, html_content)
             print(f"HTML报告已保存到: {output_file}")
         else:
             print(html_content)
@@ -560,25 +761,20 @@ class SimpleReportGenerator:
         lines.append("")
 
         # 问题详情
-        if result.issues_found:
+        if self.include_details and result.issues_found:
             lines.append("## ⚠️ 发现的问题")
             lines.append("")
-            for i, issue in enumerate(result.issues_found[:10], 1):
-                severity = issue.get('severity', 'UNKNOWN')
-                issue_type = issue.get('type', 'unknown')
-                message = issue.get('message', '无详细信息')
+            for i, severity, issue_type, message in self._issue_rows(result):
                 lines.append(f"### {i}. [{severity}] {issue_type}")
                 lines.append("")
                 lines.append(f"{message}")
                 lines.append("")
 
         # 修复详情
-        if result.auto_fixes_applied:
+        if self.include_details and result.auto_fixes_applied:
             lines.append("## 🔧 自动修复")
             lines.append("")
-            for i, fix in enumerate(result.auto_fixes_applied[:5], 1):
-                fix_type = fix.get('type', 'unknown')
-                description = fix.get('description', '无描述')
+            for i, fix_type, description in self._fix_rows(result):
                 lines.append(f"### {i}. {fix_type}")
                 lines.append("")
                 lines.append(f"{description}")
@@ -587,7 +783,7 @@ class SimpleReportGenerator:
         report_content = "\n".join(lines)
 
         if output_file:
-            Path(output_file).write_text(report_content, encoding='utf-8')
+            _write_report(output_file, report_content)
             print(f"Markdown报告已保存到: {output_file}")
         else:
             print(report_content)
@@ -657,6 +853,18 @@ def main():
         help='输出文件路径'
     )
 
+    parser.add_argument(
+        '--cached',
+        action='store_true',
+        help='源码和配置未变化时复用上次的验证结果（不缓存失败结果）'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='与 --cached 一起使用时忽略已有缓存，重新执行验证'
+    )
+
     parser.add_argument(
         '--no-auto-fix',
         action='store_true',
@@ -683,6 +891,10 @@ def main():
     if args.no_auto_fix:
         verifier.config['auto_fix']['enable_auto_fix'] = False
 
+    # 启用验证结果缓存（如果指定）
+    if args.cached:
+        verifier.config.setdefault('cache', {})['enabled'] = True
+
     try:
         # 根据参数选择验证模式
         if args.verify_spdx:
@@ -695,7 +907,7 @@ def main():
             result = verifier.integration_tester.run_all_tests()
             status = result.status
         else:
-            result = verifier.verify_all(args.mode)
+            result = verifier.verify_all(args.mode, force=args.force)
             status = result.overall_status
 
         # 生成报告
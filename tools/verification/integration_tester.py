@@ -11,10 +11,11 @@ import subprocess
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
-import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根目录和src到Python路径
 project_root = Path(__file__).parent.parent.parent
@@ -23,14 +24,62 @@ sys.path.insert(0, str(project_root / "src"))
 
 try:
     from spdx_scanner.scanner import create_default_scanner
-    from spdx_scanner.parser import SPDXParser
+    from spdx_scanner.parser import SPDXParser, create_default_parser
     from spdx_scanner.validator import create_default_validator
     from spdx_scanner.corrector import SPDXCorrector
-    from spdx_scanner.config import ConfigManager
+    from spdx_scanner.config import ConfigManager, Configuration
+    from spdx_scanner.reporter import create_default_reporter
+    from spdx_scanner.models import ScanResult
 except ImportError as e:
     print(f"导入错误: {e}")
 
 
+# 测试套件在结果中的排列顺序
+_SUITE_ORDER = (
+    'cli', 'config', 'file_processing', 'reporting',
+    'end_to_end', 'performance', 'error_handling', 'git_integration',
+)
+
+# 内存文件系统，存在且可写时用于存放测试临时目录
+_SHM_DIR = '/dev/shm'
+
+
+def _default_tmp_root() -> Optional[str]:
+    """返回默认的临时目录根，不可用时返回None（使用系统临时目录）"""
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return None
+
+
+# 只输出帮助或版本信息的CLI参数，结果不随调用变化，可以缓存
+_PURE_CLI_FLAGS = frozenset({'--help', '--version'})
+
+
+# 报告生成测试覆盖的格式：(格式, 显示名, 文件后缀, 失败时的严重程度)
+_REPORT_FORMATS = (
+    ('json', 'JSON', 'json', 'HIGH'),
+    ('html', 'HTML', 'html', 'HIGH'),
+    ('markdown', 'Markdown', 'md', 'MEDIUM'),
+)
+
+
+# 性能测试文件模板，三处 %d 依次填入文件编号
+_PERF_FILE_TEMPLATE = b"""/*
+ * SPDX-License-Identifier: MIT
+ * Copyright (c) 2023 Corp %d
+ */
+
+#include <stdio.h>
+
+void function_%d() {
+    printf("File %d\\n");
+}
+"""
+
+# 写入测试文件的打开标志（Windows 上需要 O_BINARY 避免换行转换）
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
 @dataclass
 class IntegrationTestResult:
     """集成测试结果"""
@@ -41,6 +90,16 @@ class IntegrationTestResult:
     recommendations: List[str]
 
 
+def _write_file(item: Tuple[Path, bytes]):
+    """用一次 open/write/close 写入单个测试文件"""
+    path, data = item
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 class IntegrationTester:
     """集成测试器"""
 
@@ -49,61 +108,60 @@ class IntegrationTester:
         self.config = config
         self.test_results = {}
 
+        # 测试临时目录的根，可通过配置 tmp_dir 指定
+        self._tmp_root = config.get('tmp_dir') or _default_tmp_root()
+
+        # 测试套件并发执行时，保证每行进度输出完整
+        self._print_lock = threading.Lock()
+
+        # 进程内扫描组件，首次使用时创建
+        self._scan_lock = threading.Lock()
+        self._scan_components = None
+
+        # 纯查询类CLI命令的结果缓存，键为（参数元组, 是否捕获标准输出）
+        self._cli_cache: Dict[Tuple[Tuple[str, ...], bool], Dict[str, Any]] = {}
+
+        # CLI子进程环境：直接从源码目录导入被测包，且不写入字节码缓存
+        python_path = [str(project_root / "src")]
+        if os.environ.get('PYTHONPATH'):
+            python_path.append(os.environ['PYTHONPATH'])
+        self._cli_env = dict(os.environ, PYTHONPATH=os.pathsep.join(python_path), PYTHONDONTWRITEBYTECODE='1')
+
+    def _print(self, message: str):
+        """线程安全地输出进度信息"""
+        with self._print_lock:
+            print(message)
+
     def run_all_tests(self) -> IntegrationTestResult:
         """运行所有集成测试"""
-        print("🔗 开始集成测试...")
+        self._print("🔗 开始集成测试...")
+
+        # 1-5, 7-8. 各测试套件使用独立的临时目录，以子进程和文件I/O为主，并发执行
+        suites = [
+            ('cli', self._test_cli_interface),                        # CLI接口测试
+            ('config', self._test_configuration_handling),            # 配置文件测试
+            ('file_processing', self._test_file_processing),          # 文件处理测试
+            ('reporting', self._test_report_generation),              # 报告生成测试
+            ('end_to_end', self._test_end_to_end),                    # 端到端测试
+            ('error_handling', self._test_error_handling),            # 错误处理测试
+        ]
+        if self.config.get('test_git_integration', True):
+            suites.append(('git_integration', self._test_git_integration))  # Git集成测试
+
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            futures = [(name, executor.submit(run)) for name, run in suites]
+            suite_results = {name: future.result() for name, future in futures}
 
-        test_suites = {}
+        # 6. 性能测试：在其他套件完成后单独运行，避免计时受并发负载影响
+        suite_results['performance'] = self._test_performance()
+        performance_metrics = suite_results['performance'].get('metrics', {})
+
+        # 按固定顺序汇总结果
+        test_suites = {name: suite_results[name] for name in _SUITE_ORDER if name in suite_results}
         issues = []
-        performance_metrics = {}
-
-        # 1. CLI接口测试
-        cli_result = self._test_cli_interface()
-        test_suites['cli'] = cli_result
-        if cli_result.get('issues'):
-            issues.extend(cli_result['issues'])
-
-        # 2. 配置文件测试
-        config_result = self._test_configuration_handling()
-        test_suites['config'] = config_result
-        if config_result.get('issues'):
-            issues.extend(config_result['issues'])
-
-        # 3. 文件处理测试
-        file_result = self._test_file_processing()
-        test_suites['file_processing'] = file_result
-        if file_result.get('issues'):
-            issues.extend(file_result['issues'])
-
-        # 4. 报告生成测试
-        report_result = self._test_report_generation()
-        test_suites['reporting'] = report_result
-        if report_result.get('issues'):
-            issues.extend(report_result['issues'])
-
-        # 5. 端到端测试
-        e2e_result = self._test_end_to_end()
-        test_suites['end_to_end'] = e2e_result
-        if e2e_result.get('issues'):
-            issues.extend(e2e_result['issues'])
-
-        # 6. 性能测试
-        perf_result = self._test_performance()
-        test_suites['performance'] = perf_result
-        performance_metrics = perf_result.get('metrics', {})
-
-        # 7. 错误处理测试
-        error_result = self._test_error_handling()
-        test_suites['error_handling'] = error_result
-        if error_result.get('issues'):
-            issues.extend(error_result['issues'])
-
-        # 8. Git集成测试（如果可用）
-        if self.config.get('test_git_integration', True):
-            git_result = self._test_git_integration()
-            test_suites['git_integration'] = git_result
-            if git_result.get('issues'):
-                issues.extend(git_result['issues'])
+        for suite_result in test_suites.values():
+            if suite_result.get('issues'):
+                issues.extend(suite_result['issues'])
 
         # 确定整体状态
         failed_suites = [name for name, result in test_suites.items() if result.get('status') == 'FAIL']
@@ -129,7 +187,7 @@ class IntegrationTester:
 
     def _test_cli_interface(self) -> Dict[str, Any]:
         """测试CLI接口"""
-        print("  🖥️  测试CLI接口...")
+        self._print("  🖥️  测试CLI接口...")
 
         result = {
             'test_suite': 'CLI Interface',
@@ -166,8 +224,19 @@ class IntegrationTester:
                 'details': f'检查异常: {str(e)}'
             })
 
+        # 各CLI探测命令互不依赖，并发启动以重叠解释器启动时间
+        # 只有版本命令需要检查标准输出
+        probes = [
+            (['--help'], False),
+            (['--version'], True),
+            (['scan', '--help'], False),
+            (['correct', '--help'], False),
+        ]
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = [executor.submit(self._run_cli_command, args, capture) for args, capture in probes]
+            help_result, version_result, scan_result, correct_result = (f.result() for f in futures)
+
         # 测试帮助命令
-        help_result = self._run_cli_command(['--help'])
         if help_result['success']:
             result['tests'].append({
                 'name': '帮助命令',
@@ -188,7 +257,6 @@ class IntegrationTester:
             })
 
         # 测试版本命令
-        version_result = self._run_cli_command(['--version'])
         if version_result['success']:
             result['tests'].append({
                 'name': '版本命令',
@@ -209,7 +277,6 @@ class IntegrationTester:
             })
 
         # 测试scan命令
-        scan_result = self._run_cli_command(['scan', '--help'])
         if scan_result['success']:
             result['tests'].append({
                 'name': 'Scan子命令',
@@ -230,7 +297,6 @@ class IntegrationTester:
             })
 
         # 测试correct命令
-        correct_result = self._run_cli_command(['correct', '--help'])
         if correct_result['success']:
             result['tests'].append({
                 'name': 'Correct子命令',
@@ -252,21 +318,39 @@ class IntegrationTester:
 
         return result
 
-    def _run_cli_command(self, args: List[str]) -> Dict[str, Any]:
-        """运行CLI命令"""
+    def _run_cli_command(self, args: List[str], capture_stdout: bool = False) -> Dict[str, Any]:
+        """运行CLI命令，帮助和版本查询的结果会被缓存
+
+        默认丢弃标准输出（结果中 stdout 为空字符串），需要检查输出时传入 capture_stdout=True。
+        """
+        key = (tuple(args), capture_stdout)
+        cached = self._cli_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._execute_cli_command(args, capture_stdout)
+        # 超时或启动失败（返回码-1）不缓存，留给下次重试
+        if result['returncode'] != -1 and _PURE_CLI_FLAGS.intersection(args):
+            self._cli_cache[key] = result
+        return result
+
+    def _execute_cli_command(self, args: List[str], capture_stdout: bool) -> Dict[str, Any]:
+        """在子进程中执行CLI命令，输出按字节捕获，只解码需要的部分"""
         try:
             result = subprocess.run(
                 [sys.executable, "-m", "spdx_scanner"] + args,
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
+                env=self._cli_env,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=30
             )
+            # 调用方只在失败时查看 stderr
             return {
                 'success': result.returncode == 0,
                 'returncode': result.returncode,
-                'stdout': result.stdout,
-                'stderr': result.stderr
+                'stdout': result.stdout.decode('utf-8', 'replace') if capture_stdout else '',
+                'stderr': result.stderr.decode('utf-8', 'replace') if result.returncode != 0 else ''
             }
         except subprocess.TimeoutExpired:
             return {
@@ -283,9 +367,67 @@ class IntegrationTester:
                 'stderr': str(e)
             }
 
+    def _write_files(self, files: List[Tuple[Path, bytes]]):
+        """并发写入测试文件，父目录需已存在"""
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(files)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_write_file, files))
+
+    def _scan_pipeline(self) -> Tuple[Any, Any, Any, Any]:
+        """返回扫描所需的 scanner、parser、validator 和 reporter
+
+        首次使用时创建，之后在各测试套件间共享（扫描过程不修改它们的状态）。
+        """
+        with self._scan_lock:
+            if self._scan_components is None:
+                self._scan_components = (
+                    create_default_scanner(),
+                    create_default_parser(),
+                    create_default_validator(),
+                    create_default_reporter(),
+                )
+            return self._scan_components
+
+    def _scan_results(self, path: Path) -> Tuple[List[Any], Any]:
+        """在进程内扫描目录，返回扫描结果列表和汇总"""
+        scanner, parser, validator, reporter = self._scan_pipeline()
+        results = []
+        for file_info in scanner.scan_directory(path):
+            file_info.spdx_info = parser.parse_file(file_info)
+            results.append(ScanResult(
+                file_info=file_info,
+                validation_result=validator.validate(file_info.spdx_info),
+            ))
+        return results, reporter.create_summary(results)
+
+    def _scan_inproc(self, path: Path, fmt: str = 'text', output: Optional[Path] = None) -> Dict[str, Any]:
+        """在进程内执行与 `spdx_scanner scan` 相同的流程，省去启动解释器和导入模块的开销
+
+        返回与 _run_cli_command 相同结构的结果，返回码与CLI一致：
+        0 表示全部有效，1 表示存在无效文件，2 表示扫描出错。
+        """
+        try:
+            results, summary = self._scan_results(path)
+            reporter = self._scan_pipeline()[3]
+            report = reporter.generate_report(results, summary, fmt, str(output) if output else None)
+            returncode = 0 if summary.invalid_files == 0 else 1
+            return {
+                'success': returncode == 0,
+                'returncode': returncode,
+                'stdout': '' if output else report,
+                'stderr': ''
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'returncode': 2,
+                'stdout': '',
+                'stderr': str(e)
+            }
+
     def _test_configuration_handling(self) -> Dict[str, Any]:
         """测试配置处理"""
-        print("  ⚙️  测试配置处理...")
+        self._print("  ⚙️  测试配置处理...")
 
         result = {
             'test_suite': 'Configuration',
@@ -294,18 +436,18 @@ class IntegrationTester:
             'issues': []
         }
 
-        # 创建临时配置测试目录
-        test_dir = Path(tempfile.mkdtemp())
+        # 创建临时配置测试目录（仅用于配置文件往返测试）
+        test_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
             # 测试默认配置
-            config_manager = ConfigManager(str(test_dir))
+            config_manager = ConfigManager()
             default_config = config_manager.get_config()
 
             if default_config:
                 result['tests'].append({
                     'name': '默认配置加载',
                     'status': 'PASS',
-                    'details': f'配置项数量: {len(default_config)}'
+                    'details': f'配置项数量: {len(default_config.to_dict())}'
                 })
             else:
                 result['tests'].append({
@@ -314,8 +456,7 @@ class IntegrationTester:
                     'details': '默认配置为空'
                 })
 
-            # 测试配置文件创建
-            test_config_file = test_dir / "spdx-scanner.config.json"
+            # 测试配置加载（在内存中从字典构建，不经过文件）
             test_config = {
                 "project_name": "Test Project",
                 "default_license": "MIT",
@@ -324,38 +465,34 @@ class IntegrationTester:
                 }
             }
 
-            with open(test_config_file, 'w') as f:
-                json.dump(test_config, f, indent=2)
-
-            # 重新加载配置
-            config_manager_reload = ConfigManager(str(test_dir))
-            loaded_config = config_manager_reload.get_config()
+            config_manager.config = Configuration.from_dict(test_config)
+            loaded_config = config_manager.get_config()
 
-            if loaded_config and loaded_config.get('project_name') == 'Test Project':
+            if loaded_config.project_name == 'Test Project':
                 result['tests'].append({
-                    'name': '配置文件加载',
+                    'name': '配置加载',
                     'status': 'PASS',
-                    'details': '配置文件正确加载'
+                    'details': '配置正确加载'
                 })
             else:
                 result['tests'].append({
-                    'name': '配置文件加载',
+                    'name': '配置加载',
                     'status': 'FAIL',
-                    'details': '配置文件加载失败'
+                    'details': '配置加载失败'
                 })
                 result['issues'].append({
                     'type': 'config_error',
                     'component': 'Config',
-                    'message': '配置文件加载失败',
+                    'message': '配置加载失败',
                     'severity': 'MEDIUM'
                 })
 
             # 测试配置更新
             try:
-                config_manager_reload.update_config('project_name', 'Updated Project')
-                updated_config = config_manager_reload.get_config()
+                config_manager.update_from_args({'project_name': 'Updated Project'})
+                updated_config = config_manager.get_config()
 
-                if updated_config.get('project_name') == 'Updated Project':
+                if updated_config.project_name == 'Updated Project':
                     result['tests'].append({
                         'name': '配置更新',
                         'status': 'PASS',
@@ -380,6 +517,30 @@ class IntegrationTester:
                     'severity': 'MEDIUM'
                 })
 
+            # 测试配置文件往返（唯一的磁盘读写，覆盖文件格式）
+            test_config_file = test_dir / "spdx-scanner.config.json"
+            config_manager.save_config(test_config_file)
+            reloaded_config = ConfigManager().load_config(test_config_file)
+
+            if reloaded_config.to_dict() == config_manager.get_config().to_dict():
+                result['tests'].append({
+                    'name': '配置文件往返',
+                    'status': 'PASS',
+                    'details': '配置文件保存后正确加载'
+                })
+            else:
+                result['tests'].append({
+                    'name': '配置文件往返',
+                    'status': 'FAIL',
+                    'details': '配置文件保存后加载结果不一致'
+                })
+                result['issues'].append({
+                    'type': 'config_error',
+                    'component': 'Config',
+                    'message': '配置文件往返失败',
+                    'severity': 'MEDIUM'
+                })
+
         except Exception as e:
             result['tests'].append({
                 'name': '配置测试',
@@ -400,7 +561,7 @@ class IntegrationTester:
 
     def _test_file_processing(self) -> Dict[str, Any]:
         """测试文件处理"""
-        print("  📁 测试文件处理...")
+        self._print("  📁 测试文件处理...")
 
         result = {
             'test_suite': 'File Processing',
@@ -410,7 +571,7 @@ class IntegrationTester:
         }
 
         # 创建临时测试目录
-        test_dir = Path(tempfile.mkdtemp())
+        test_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
             # 创建测试文件（使用默认scanner支持的文件类型）
             test_files = [
@@ -420,8 +581,7 @@ class IntegrationTester:
                 ('test.go', '// SPDX-License-Identifier: MIT\npackage main')
             ]
 
-            for filename, content in test_files:
-                (test_dir / filename).write_text(content)
+            self._write_files([(test_dir / filename, content.encode()) for filename, content in test_files])
 
             # 测试文件扫描
             scanner = create_default_scanner()
@@ -483,8 +643,9 @@ class IntegrationTester:
             text_file = test_dir / "text.txt"
             text_file.write_text("This is a text file\n")
 
-            all_files = list(test_dir.glob('*'))
-            total_files = len([f for f in all_files if f.is_file()])
+            # scandir 的目录项自带文件类型，无需逐个 stat
+            with os.scandir(test_dir) as entries:
+                total_files = sum(1 for entry in entries if entry.is_file())
 
             if total_files == len(test_files) + 2:  # 原始文件 + 额外文件
                 result['tests'].append({
@@ -519,7 +680,7 @@ class IntegrationTester:
 
     def _test_report_generation(self) -> Dict[str, Any]:
         """测试报告生成"""
-        print("  📊 测试报告生成...")
+        self._print("  📊 测试报告生成...")
 
         result = {
             'test_suite': 'Report Generation',
@@ -529,7 +690,7 @@ class IntegrationTester:
         }
 
         # 创建测试数据
-        test_dir = Path(tempfile.mkdtemp())
+        test_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
             # 创建测试文件
             test_file = test_dir / "test.c"
@@ -541,11 +702,10 @@ class IntegrationTester:
 #include <stdio.h>
 """)
 
-            # 执行扫描
-            scanner = create_default_scanner()
-            scan_result = scanner.scan_directory(str(test_dir))
+            # 只扫描一次，各报告格式共用同一份扫描结果
+            scan_results, summary = self._scan_results(test_dir)
 
-            if not scan_result:
+            if not scan_results:
                 result['tests'].append({
                     'name': '扫描执行',
                     'status': 'FAIL',
@@ -559,89 +719,33 @@ class IntegrationTester:
                 })
                 return result
 
-            # 测试JSON报告
-            json_report_file = test_dir / "report.json"
-            json_result = self._run_cli_command([
-                'scan',
-                '--format', 'json',
-                '--output', str(json_report_file),
-                str(test_dir)
-            ])
-
-            if json_result['success'] and json_report_file.exists():
-                result['tests'].append({
-                    'name': 'JSON报告生成',
-                    'status': 'PASS',
-                    'details': f'报告大小: {json_report_file.stat().st_size} 字节'
-                })
-            else:
-                result['tests'].append({
-                    'name': 'JSON报告生成',
-                    'status': 'FAIL',
-                    'details': f'JSON报告生成失败: {json_result["stderr"]}'
-                })
-                result['issues'].append({
-                    'type': 'report_error',
-                    'component': 'Reporting',
-                    'message': 'JSON报告生成失败',
-                    'severity': 'HIGH'
-                })
+            reporter = self._scan_pipeline()[3]
+            for fmt, label, suffix, severity in _REPORT_FORMATS:
+                report_file = test_dir / f"report.{suffix}"
+                try:
+                    reporter.generate_report(scan_results, summary, fmt, str(report_file))
+                    error = ''
+                except Exception as e:
+                    error = str(e)
 
-            # 测试HTML报告
-            html_report_file = test_dir / "report.html"
-            html_result = self._run_cli_command([
-                'scan',
-                '--format', 'html',
-                '--output', str(html_report_file),
-                str(test_dir)
-            ])
-
-            if html_result['success'] and html_report_file.exists():
-                result['tests'].append({
-                    'name': 'HTML报告生成',
-                    'status': 'PASS',
-                    'details': f'报告大小: {html_report_file.stat().st_size} 字节'
-                })
-            else:
-                result['tests'].append({
-                    'name': 'HTML报告生成',
-                    'status': 'FAIL',
-                    'details': f'HTML报告生成失败: {html_result["stderr"]}'
-                })
-                result['issues'].append({
-                    'type': 'report_error',
-                    'component': 'Reporting',
-                    'message': 'HTML报告生成失败',
-                    'severity': 'HIGH'
-                })
-
-            # 测试Markdown报告
-            md_report_file = test_dir / "report.md"
-            md_result = self._run_cli_command([
-                'scan',
-                '--format', 'markdown',
-                '--output', str(md_report_file),
-                str(test_dir)
-            ])
-
-            if md_result['success'] and md_report_file.exists():
-                result['tests'].append({
-                    'name': 'Markdown报告生成',
-                    'status': 'PASS',
-                    'details': f'报告大小: {md_report_file.stat().st_size} 字节'
-                })
-            else:
-                result['tests'].append({
-                    'name': 'Markdown报告生成',
-                    'status': 'FAIL',
-                    'details': f'Markdown报告生成失败: {md_result["stderr"]}'
-                })
-                result['issues'].append({
-                    'type': 'report_error',
-                    'component': 'Reporting',
-                    'message': 'Markdown报告生成失败',
-                    'severity': 'MEDIUM'
-                })
+                if not error and report_file.exists() and report_file.stat().st_size > 0:
+                    result['tests'].append({
+                        'name': f'{label}报告生成',
+                        'status': 'PASS',
+                        'details': f'报告大小: {report_file.stat().st_size} 字节'
+                    })
+                else:
+                    result['tests'].append({
+                        'name': f'{label}报告生成',
+                        'status': 'FAIL',
+                        'details': f'{label}报告生成失败: {error}'
+                    })
+                    result['issues'].append({
+                        'type': 'report_error',
+                        'component': 'Reporting',
+                        'message': f'{label}报告生成失败',
+                        'severity': severity
+                    })
 
         except Exception as e:
             result['tests'].append({
@@ -663,7 +767,7 @@ class IntegrationTester:
 
     def _test_end_to_end(self) -> Dict[str, Any]:
         """测试端到端流程"""
-        print("  🔄 测试端到端流程...")
+        self._print("  🔄 测试端到端流程...")
 
         result = {
             'test_suite': 'End-to-End',
@@ -673,7 +777,7 @@ class IntegrationTester:
         }
 
         # 创建完整的测试项目
-        test_dir = Path(tempfile.mkdtemp())
+        test_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
             # 创建项目结构
             project_files = [
@@ -684,14 +788,13 @@ class IntegrationTester:
                 ('README.md', '# Test Project\nNo license info.')
             ]
 
-            for filepath, content in project_files:
-                full_path = test_dir / filepath
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                full_path.write_text(content)
+            for parent in {(test_dir / filepath).parent for filepath, _ in project_files}:
+                parent.mkdir(parents=True, exist_ok=True)
+            self._write_files([(test_dir / filepath, content.encode()) for filepath, content in project_files])
 
             # 测试完整的扫描-修正流程
-            print("    执行完整扫描...")
-            scan_result = self._run_cli_command(['scan', str(test_dir)])
+            self._print("    执行完整扫描...")
+            scan_result = self._scan_inproc(test_dir)
 
             if not scan_result['success']:
                 result['tests'].append({
@@ -714,7 +817,7 @@ class IntegrationTester:
             })
 
             # 测试自动修正
-            print("    执行自动修正...")
+            self._print("    执行自动修正...")
             correct_result = self._run_cli_command([
                 'correct',
                 '--dry-run',
@@ -741,13 +844,8 @@ class IntegrationTester:
                 })
 
             # 测试报告生成
-            print("    生成最终报告...")
-            report_result = self._run_cli_command([
-                'scan',
-                '--format', 'json',
-                '--output', str(test_dir / 'final_report.json'),
-                str(test_dir)
-            ])
+            self._print("    生成最终报告...")
+            report_result = self._scan_inproc(test_dir, 'json', test_dir / 'final_report.json')
 
             if report_result['success']:
                 result['tests'].append({
@@ -782,7 +880,7 @@ class IntegrationTester:
 
     def _test_performance(self) -> Dict[str, Any]:
         """测试性能"""
-        print("  ⚡ 测试性能...")
+        self._print("  ⚡ 测试性能...")
 
         result = {
             'test_suite': 'Performance',
@@ -792,28 +890,19 @@ class IntegrationTester:
         }
 
         # 创建大量测试文件
-        test_dir = Path(tempfile.mkdtemp())
+        test_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
             file_count = 50
-            print(f"    创建 {file_count} 个测试文件...")
+            self._print(f"    创建 {file_count} 个测试文件...")
 
-            for i in range(file_count):
-                test_file = test_dir / f"file_{i:03d}.c"
-                test_file.write_text(f"""/*
- * SPDX-License-Identifier: MIT
- * Copyright (c) 2023 Corp {i}
- */
-
-#include <stdio.h>
-
-void function_{i}() {{
-    printf("File {i}\\n");
-}}
-""")
+            self._write_files([
+                (test_dir / f"file_{i:03d}.c", _PERF_FILE_TEMPLATE % (i, i, i))
+                for i in range(file_count)
+            ])
 
             # 测试扫描性能
             start_time = time.time()
-            scan_result = self._run_cli_command(['scan', str(test_dir)])
+            scan_result = self._scan_inproc(test_dir)
             scan_duration = time.time() - start_time
 
             if scan_result['success']:
@@ -853,7 +942,7 @@ void function_{i}() {{
 
     def _test_error_handling(self) -> Dict[str, Any]:
         """测试错误处理"""
-        print("  🛡️  测试错误处理...")
+        self._print("  🛡️  测试错误处理...")
 
         result = {
             'test_suite': 'Error Handling',
@@ -862,7 +951,7 @@ void function_{i}() {{
         }
 
         # 测试无效目录
-        invalid_dir_result = self._run_cli_command(['scan', '/nonexistent/directory'])
+        invalid_dir_result = self._scan_inproc(Path('/nonexistent/directory'))
         if not invalid_dir_result['success']:
             result['tests'].append({
                 'name': '无效目录处理',
@@ -877,9 +966,9 @@ void function_{i}() {{
             })
 
         # 测试空目录
-        empty_dir = Path(tempfile.mkdtemp())
+        empty_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
-            empty_result = self._run_cli_command(['scan', str(empty_dir)])
+            empty_result = self._scan_inproc(empty_dir)
             if not empty_result['success']:
                 result['tests'].append({
                     'name': '空目录处理',
@@ -899,7 +988,7 @@ void function_{i}() {{
 
     def _test_git_integration(self) -> Dict[str, Any]:
         """测试Git集成"""
-        print("  🌿 测试Git集成...")
+        self._print("  🌿 测试Git集成...")
 
         result = {
             'test_suite': 'Git Integration',
@@ -924,7 +1013,7 @@ void function_{i}() {{
             return result
 
         # 创建Git仓库测试
-        test_dir = Path(tempfile.mkdtemp())
+        test_dir = Path(tempfile.mkdtemp(dir=self._tmp_root))
         try:
             # 初始化Git仓库
             subprocess.run(['git', 'init'], cwd=test_dir, check=True, capture_output=True)